@@ -1,5 +1,17 @@
+import os
 from setuptools import setup, find_packages
 
+try:
+    from mypyc.build import mypycify
+except ImportError:
+    mypycify = None
+
+# Opt-in native build of the frame scoring kernel:
+#   IMPACT_PREDICTOR_MYPYC=1 pip install .
+ext_modules = []
+if mypycify is not None and os.environ.get("IMPACT_PREDICTOR_MYPYC"):
+    ext_modules = mypycify(["src/policy_argument_mining/_frame_kernels.py"])
+
 setup(
     name="impact_predictor",
     version="0.1.0",
@@ -19,4 +31,5 @@ setup(
         "pytz==2023.3.post1"
     ],
     python_requires=">=3.8",
+    ext_modules=ext_modules,
 ) 
\ No newline at end of file
@@ -7,6 +7,7 @@ This module provides API endpoints for policy argument mining and analysis.
 from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel
 from typing import List, Dict, Any, Optional
+from dataclasses import asdict
 import logging
 
 from ...policy_argument_mining import (
@@ -161,7 +162,7 @@ async def analyze_arguments(request: ArgumentAnalysisRequest):
                 "claim": claim.claim_text,
                 "evidence": claim.evidence_text,
                 "claim_type": claim.claim_type,
-                "score": score.__dict__
+                "score": asdict(score)
             })
         
         return {
@@ -171,9 +172,9 @@ async def analyze_arguments(request: ArgumentAnalysisRequest):
             "num_frames": len(frames),
             "num_entities": len(entities),
             "claims": scored_claims,
-            "stances": [stance.__dict__ for stance in stances],
-            "frames": [frame.__dict__ for frame in frames],
-            "entities": [entity.__dict__ for entity in entities]
+            "stances": [asdict(stance) for stance in stances],
+            "frames": [asdict(frame) for frame in frames],
+            "entities": [asdict(entity) for entity in entities]
         }
     except Exception as e:
         logger.error(f"Error analyzing arguments: {e}")
@@ -7,6 +7,7 @@ This module provides API endpoints for policy management and analysis.
 from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel
 from typing import List, Dict, Any, Optional
+from dataclasses import asdict
 import logging
 
 from ...policy_argument_mining import (
@@ -190,7 +191,7 @@ async def analyze_policy(policy_id: str, request: PolicyAnalysisRequest):
                 "claim": claim.claim_text,
                 "evidence": claim.evidence_text,
                 "claim_type": claim.claim_type,
-                "score": score.__dict__
+                "score": asdict(score)
             })
 
         # Create argument graph
@@ -214,9 +215,9 @@ async def analyze_policy(policy_id: str, request: PolicyAnalysisRequest):
             policy_id=policy_id,
             analysis_type=request.analysis_type,
             claims=scored_claims,
-            stances=[stance.__dict__ for stance in stances],
-            frames=[frame.__dict__ for frame in frames],
-            entities=[entity.__dict__ for entity in entities],
+            stances=[asdict(stance) for stance in stances],
+            frames=[asdict(frame) for frame in frames],
+            entities=[asdict(entity) for entity in entities],
             argument_graph=graph.to_dict(),
             summary=summary
         )
@@ -4,18 +4,36 @@ Financial Predictor Module.
 This module provides financial prediction capabilities for startups.
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 import logging
 import random
 # import numpy as np  # Commented out for compatibility
 from datetime import datetime, timedelta
+from types import MappingProxyType
 
 logger = logging.getLogger(__name__)
 
+# Fallback metric values used when a model (or the whole pipeline) fails.
+# Kept frozen so per-model failure paths can share it without copying.
+_DEFAULT_METRICS = MappingProxyType({
+    'revenue': 1000000.0,
+    'profit': 100000.0,
+    'valuation': 10000000.0,
+    'market_share': 0.05,
+    'customer_acquisition_cost': 200.0,
+    'funding_availability': 0.6,
+    'operating_expenses': 800000.0,
+    'employee_retention': 0.8
+})
+
 
 class FinancialPredictor:
     """Predicts financial performance for startups."""
     
+    # Metric schema shared by every model
+    METRICS = tuple(_DEFAULT_METRICS)
+    _METRIC_SET = frozenset(METRICS)
+    
     def __init__(self):
         self.models = {
             'xgboost': self._xgboost_predict,
@@ -24,17 +42,23 @@ class FinancialPredictor:
             'neural_network': self._neural_network_predict
         }
     
-    def predict_financials(self, startup_data: Dict[str, Any], events: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def predict_financials(self, startup_data: Dict[str, Any], events: List[Dict[str, Any]],
+                           prediction_date: Optional[str] = None) -> Dict[str, Any]:
         """
         Predict financial performance based on startup data and events.
         
         Args:
             startup_data: Startup information and historical data
             events: List of events that may impact performance
+            prediction_date: ISO timestamp to stamp on the result; batch callers
+                can pass one value for many startups. Defaults to now.
             
         Returns:
             Financial predictions
         """
+        if prediction_date is None:
+            prediction_date = datetime.now().isoformat()
+        
         try:
             # Extract features
             features = self._extract_features(startup_data, events)
@@ -48,13 +72,14 @@ class FinancialPredictor:
                     predictions[model_name] = model_predictions
                 except Exception as e:
                     logger.warning(f"Model {model_name} failed: {e}")
-                    predictions[model_name] = self._default_predictions()
+                    # Ensemble averaging only needs the metrics, not the metadata
+                    predictions[model_name] = _DEFAULT_METRICS
             
             # Combine predictions using ensemble
             ensemble_predictions = self._ensemble_predictions(predictions)
             
             # Add metadata
-            ensemble_predictions['prediction_date'] = datetime.now().isoformat()
+            ensemble_predictions['prediction_date'] = prediction_date
             ensemble_predictions['model_versions'] = list(self.models.keys())
             ensemble_predictions['confidence'] = self._calculate_confidence(predictions)
             
@@ -62,7 +87,7 @@ class FinancialPredictor:
             
         except Exception as e:
             logger.error(f"Error predicting financials: {e}")
-            return self._default_predictions()
+            return self._default_predictions(prediction_date=prediction_date)
     
     def _extract_features(self, startup_data: Dict[str, Any], events: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Extract features for prediction."""
@@ -190,14 +215,9 @@ class FinancialPredictor:
         if not predictions:
             return self._default_predictions()
         
-        # Get all metric names
-        all_metrics = set()
-        for model_preds in predictions.values():
-            all_metrics.update(model_preds.keys())
-        
         ensemble = {}
         
-        for metric in all_metrics:
+        for metric in self._metric_keys(predictions):
             values = []
             for model_preds in predictions.values():
                 if metric in model_preds:
@@ -217,14 +237,10 @@ class FinancialPredictor:
             return 0.0
         
         # Calculate variance across models for each metric
-        all_metrics = set()
-        for model_preds in predictions.values():
-            all_metrics.update(model_preds.keys())
-        
         total_variance = 0.0
         metric_count = 0
         
-        for metric in all_metrics:
+        for metric in self._metric_keys(predictions):
             values = []
             for model_preds in predictions.values():
                 if metric in model_preds:
@@ -246,18 +262,24 @@ class FinancialPredictor:
         
         return confidence
     
-    def _default_predictions(self) -> Dict[str, float]:
+    def _metric_keys(self, predictions: Dict[str, Dict[str, float]]) -> Tuple[str, ...]:
+        """Return metric names, only unioning model schemas when a model adds new keys."""
+        if all(model_preds.keys() <= self._METRIC_SET for model_preds in predictions.values()):
+            return self.METRICS
+        
+        extra = []
+        for model_preds in predictions.values():
+            for metric in model_preds:
+                if metric not in self._METRIC_SET and metric not in extra:
+                    extra.append(metric)
+        
+        return self.METRICS + tuple(extra)
+    
+    def _default_predictions(self, prediction_date: Optional[str] = None) -> Dict[str, float]:
         """Return default predictions when models fail."""
         return {
-            'revenue': 1000000.0,
-            'profit': 100000.0,
-            'valuation': 10000000.0,
-            'market_share': 0.05,
-            'customer_acquisition_cost': 200.0,
-            'funding_availability': 0.6,
-            'operating_expenses': 800000.0,
-            'employee_retention': 0.8,
-            'prediction_date': datetime.now().isoformat(),
+            **_DEFAULT_METRICS,
+            'prediction_date': prediction_date or datetime.now().isoformat(),
             'model_versions': ['default'],
             'confidence': 0.3
         }
\ No newline at end of file
@@ -0,0 +1,41 @@
+"""
+Frame scoring kernel.
+
+The per-pattern counting loop behind frame detection lives here, with
+concrete annotations only, so that it can be compiled with mypyc (see
+setup.py). Without a compiled build this module is imported as plain Python.
+"""
+
+from typing import List, Pattern, Tuple
+
+
+def score_patterns(text_lower: str, patterns: List[Pattern[str]], weight: float = 1.0) -> Tuple[float, str]:
+    """
+    Score text against a frame's patterns.
+    
+    Matches are counted without materializing them, and scanning stops
+    as soon as ``confidence * weight`` reaches the 1.0 cap.
+    
+    Args:
+        text_lower: Lowercased text to analyze
+        patterns: Patterns to match
+        weight: Factor the caller applies before capping at 1.0
+        
+    Returns:
+        Tuple of (confidence, evidence_text)
+    """
+    confidence = 0.0
+    evidence_text = ""
+    
+    for pattern in patterns:
+        count = 0
+        for match in pattern.finditer(text_lower):
+            # Use the first match as evidence
+            if not evidence_text:
+                evidence_text = match.group(1)
+            count += 1
+            if (confidence + count * 0.2) * weight >= 1.0:
+                return confidence + count * 0.2, evidence_text
+        confidence += count * 0.2
+    
+    return confidence, evidence_text
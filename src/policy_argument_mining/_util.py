@@ -0,0 +1,76 @@
+"""
+Shared text utilities for the policy argument mining pipeline.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+import functools
+import multiprocessing
+import sys
+
+# Slotted dataclasses drop the per-instance __dict__ (Python 3.10+)
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Worker processes are spawned, not forked: forking after numba's parallel
+# scoring kernel has started its thread pool leaves the interpreter hanging
+# at exit, and spawn is already the default on macOS and Windows
+MP_CONTEXT = multiprocessing.get_context('spawn')
+
+# Map every sentence terminator to '.' so str.split can do the splitting
+_SENT_DELIMS = str.maketrans('!?', '..')
+
+
+@functools.lru_cache(maxsize=4096)
+def split_sentences(text: str) -> Tuple[str, ...]:
+    """
+    Split text into sentences.
+    
+    Results are memoized so that claim detection and role labeling on the
+    same segment only split its text once.
+    
+    Args:
+        text: Text to split
+        
+    Returns:
+        Tuple of non-empty, stripped sentences
+    """
+    return tuple(s.strip() for s in text.translate(_SENT_DELIMS).split('.') if s.strip())
+
+
+# Per-process instance used by map_in_processes workers
+_worker = None
+
+
+def _init_worker(factory: Callable[[], Any]) -> None:
+    global _worker
+    _worker = factory()
+
+
+def _call_worker(call: Tuple[str, tuple]) -> Any:
+    method, args = call
+    return getattr(_worker, method)(*args)
+
+
+def map_in_processes(factory: Callable[[], Any], method: str, arg_tuples: Sequence[tuple],
+                     n_jobs: Optional[int] = None, chunksize: int = 64) -> List[Any]:
+    """
+    Call ``factory().<method>(*args)`` for every args tuple in worker processes.
+    
+    Each worker builds its own instance once, so compiled patterns and scan
+    databases are never pickled; only the arguments and results cross the
+    process boundary.
+    
+    Args:
+        factory: Picklable callable building the worker instance (e.g. a class)
+        method: Name of the method to call on the instance
+        arg_tuples: Positional arguments for each call
+        n_jobs: Number of worker processes; None or -1 uses every core
+        chunksize: Number of calls sent to a worker at a time
+        
+    Returns:
+        Results in the order of ``arg_tuples``
+    """
+    max_workers = None if n_jobs is None or n_jobs < 0 else n_jobs
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=MP_CONTEXT,
+                             initializer=_init_worker, initargs=(factory,)) as executor:
+        return list(executor.map(_call_worker, [(method, args) for args in arg_tuples], chunksize=chunksize))
@@ -5,17 +5,45 @@ This module links mentions in policy documents to organizations, policies,
 jurisdictions, and external identifiers.
 """
 
-from typing import List, Dict, Any, Optional, Set
-from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Set, Tuple
+from dataclasses import dataclass, replace
 from .ingestion import DebateSegment
 from .claim_detection import Claim
+from ._util import DATACLASS_SLOTS, map_in_processes
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from hashlib import blake2b
+import functools
 import re
+import sys
 import logging
+import numpy as np
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:
+    fuzz = None
+    process = None
 
 logger = logging.getLogger(__name__)
 
+if sys.version_info >= (3, 11):
+    # Possessive quantifiers stop the engine from re-splitting a word or
+    # whitespace run it has already consumed when a later token fails
+    _NAME_RUN = r'[A-Z][a-z]++(?:\s++[A-Z][a-z]++)*'
+    _ACRONYM_RUN = r'[A-Z]{2,}+(?:\s++[A-Z]{2,}+)*'
+else:
+    _NAME_RUN = r'[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*'
+    _ACRONYM_RUN = r'[A-Z]{2,}(?:\s+[A-Z]{2,})*'
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class Entity:
     """Represents a linked entity."""
     entity_id: str
@@ -24,9 +52,10 @@ class Entity:
     confidence: float
     source_text: str
     external_id: Optional[str] = None
+    source_segment: Optional[DebateSegment] = None  # Segment of the linked mention
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class EntityMention:
     """Represents a mention of an entity in text."""
     text: str
@@ -37,6 +66,135 @@ class EntityMention:
     source_segment: DebateSegment
 
 
+@dataclass(**DATACLASS_SLOTS)
+class MentionArrays:
+    """
+    Entity mentions of one text stored column-wise.
+    
+    Row ``i`` is the mention ``texts[i]`` of type ``entity_types[type_ids[i]]``
+    spanning ``starts[i]:ends[i]``. Downstream filtering can work on the
+    arrays directly; ``to_mentions`` builds EntityMention objects when needed.
+    """
+    starts: np.ndarray    # int32
+    ends: np.ndarray      # int32
+    type_ids: np.ndarray  # int8
+    texts: List[str]
+    entity_types: Tuple[str, ...]
+    source_segment: DebateSegment
+    confidence: float = 0.7
+    
+    def __len__(self) -> int:
+        return len(self.texts)
+    
+    def mention(self, i: int) -> EntityMention:
+        """Build the EntityMention for row ``i``."""
+        return EntityMention(
+            text=self.texts[i],
+            entity_type=self.entity_types[self.type_ids[i]],
+            start_pos=int(self.starts[i]),
+            end_pos=int(self.ends[i]),
+            confidence=self.confidence,
+            source_segment=self.source_segment
+        )
+    
+    def to_mentions(self) -> List[EntityMention]:
+        """Build EntityMention objects for every row, in extraction order."""
+        return [self.mention(i) for i in range(len(self.texts))]
+
+
+_GAZETTEER_WORD_RE = re.compile(r'\w+')
+
+
+class _Gazetteer:
+    """
+    Substring lookup over known entity names.
+    
+    Returns the first name (in insertion order) that either occurs in the
+    query or contains it, without testing each name in turn. When nothing
+    matches and rapidfuzz is installed, a run of query words closest to a
+    name of as many words is used instead (e.g. 'Federal Reserv Board').
+    Whole words are compared, so 'Housing costs' does not pass for 'house'.
+    """
+    
+    # Minimum rapidfuzz ratio between a run of query words and a name
+    fuzzy_cutoff = 90
+    
+    def __init__(self, entries: Dict[str, Dict[str, str]]):
+        self.entries = entries
+        self.names = list(entries)
+        
+        # Name indices by word count, for fuzzy matching against word runs
+        self._names_by_length: Dict[int, List[int]] = {}
+        for i, name in enumerate(self.names):
+            self._names_by_length.setdefault(len(name.split()), []).append(i)
+        
+        # Names containing the query: one find() over the names joined in order
+        self._joined = '\0'.join(self.names)
+        self._offsets = []
+        offset = 0
+        for name in self.names:
+            self._offsets.append(offset)
+            offset += len(name) + 1
+        
+        # Names occurring in the query: one Aho-Corasick pass over the query
+        self._automaton = None
+        if ahocorasick is not None and self.names:
+            self._automaton = ahocorasick.Automaton()
+            for i, name in enumerate(self.names):
+                self._automaton.add_word(name, i)
+            self._automaton.make_automaton()
+    
+    def lookup(self, text_lower: str) -> Optional[Dict[str, str]]:
+        """Return the data of the first matching name, or None."""
+        best = len(self.names)
+        
+        if '\0' not in text_lower:
+            pos = self._joined.find(text_lower)
+            if pos >= 0:
+                best = bisect_right(self._offsets, pos) - 1
+        
+        if self._automaton is not None:
+            for _, i in self._automaton.iter(text_lower):
+                if i < best:
+                    best = i
+        else:
+            for i, name in enumerate(self.names[:best]):
+                if name in text_lower:
+                    best = i
+                    break
+        
+        if best < len(self.names):
+            return self.entries[self.names[best]]
+        
+        if process is not None:
+            best = self._fuzzy_lookup(text_lower)
+            if best is not None:
+                return self.entries[self.names[best]]
+        
+        return None
+    
+    def _fuzzy_lookup(self, text_lower: str) -> Optional[int]:
+        """Index of the name closest to a same-length run of query words, or None below the cutoff."""
+        words = _GAZETTEER_WORD_RE.findall(text_lower)
+        best_score = 0.0
+        best = None
+        
+        for n_words, name_indices in self._names_by_length.items():
+            runs = [' '.join(words[i:i + n_words]) for i in range(len(words) - n_words + 1)]
+            if not runs:
+                continue
+            # Scores below the cutoff come back as 0
+            scores = process.cdist(runs, [self.names[i] for i in name_indices], scorer=fuzz.ratio,
+                                   score_cutoff=self.fuzzy_cutoff).max(axis=0)
+            for name_idx, score in zip(name_indices, scores):
+                # Ties go to the earlier name, as with exact matches
+                if score > best_score or (score == best_score and best is not None and name_idx < best):
+                    best_score = score
+                    best = name_idx
+        
+        return best
+
+
 class EntityLinker:
     """Links entity mentions to known entities and external identifiers."""
     
@@ -61,26 +219,45 @@ class EntityLinker:
             'florida': {'id': 'jur_fl', 'type': 'jurisdiction', 'external_id': 'FL'},
         }
         
+        self._org_gazetteer = _Gazetteer(self.known_organizations)
+        self._jur_gazetteer = _Gazetteer(self.known_jurisdictions)
+        
+        # Types with a gazetteer get their own linker; others become generic entities
+        self._linkers = {
+            'organization': self._link_organization,
+            'jurisdiction': self._link_jurisdiction,
+        }
+        
         # Entity patterns
-        self.entity_patterns = {
+        entity_patterns = {
             'organization': [
-                r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+(?:Corporation|Corp|Inc|LLC|Ltd|Company|Co))\b',
-                r'\b([A-Z]{2,}(?:\s+[A-Z]{2,})*)\b',  # Acronyms
+                rf'\b({_NAME_RUN}\s+(?:Corporation|Corp|Inc|LLC|Ltd|Company|Co))\b',
+                rf'\b({_ACRONYM_RUN})\b',  # Acronyms
                 r'\b(Federal\s+Reserve|SEC|FDA|EPA|Congress|Senate|House)\b',
             ],
             'policy': [
-                r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+(?:Act|Bill|Law|Regulation|Policy))\b',
+                rf'\b({_NAME_RUN}\s+(?:Act|Bill|Law|Regulation|Policy))\b',
                 r'\b(Act\s+\d+|Bill\s+\d+|Law\s+\d+)\b',
             ],
             'jurisdiction': [
                 r'\b(United\s+States|California|New\s+York|Texas|Florida)\b',
-                r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+(?:State|County|City))\b',
+                rf'\b({_NAME_RUN}\s+(?:State|County|City))\b',
             ],
             'person': [
-                r'\b(Mr\.|Mrs\.|Ms\.|Dr\.)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\b',
-                r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\b',  # Simple name pattern
+                rf'\b(Mr\.|Mrs\.|Ms\.|Dr\.)\s+({_NAME_RUN})\b',
+                rf'\b({_NAME_RUN})\b',  # Simple name pattern
             ]
         }
+        
+        # Compile once so extraction does not go through the re cache per call
+        self.entity_patterns = {
+            entity_type: [re.compile(p, re.IGNORECASE) for p in patterns]
+            for entity_type, patterns in entity_patterns.items()
+        }
+        self.entity_types = tuple(self.entity_patterns)
+        
+        # Repeated texts (reruns, quoted passages) reuse their match spans
+        self._mention_spans = functools.lru_cache(maxsize=4096)(self._find_mention_spans)
     
     def extract_entities(self, segment: DebateSegment) -> List[EntityMention]:
         """
@@ -92,23 +269,43 @@ class EntityLinker:
         Returns:
             List of entity mentions
         """
-        mentions = []
+        return self._extract_mentions_from_text(segment.text, segment)
+    
+    def extract_entity_arrays(self, segment: DebateSegment) -> MentionArrays:
+        """
+        Extract entity mentions from a debate segment as parallel arrays.
+        
+        Yields the same mentions, in the same order, as ``extract_entities``
+        without allocating an object per mention.
+        
+        Args:
+            segment: Debate segment to analyze
+            
+        Returns:
+            MentionArrays holding the segment's mentions
+        """
+        starts = array('i')
+        ends = array('i')
+        type_ids = array('b')
+        texts = []
         
-        for entity_type, patterns in self.entity_patterns.items():
+        for type_id, patterns in enumerate(self.entity_patterns.values()):
             for pattern in patterns:
-                matches = re.finditer(pattern, segment.text, re.IGNORECASE)
-                for match in matches:
-                    mention = EntityMention(
-                        text=match.group(),
-                        entity_type=entity_type,
-                        start_pos=match.start(),
-                        end_pos=match.end(),
-                        confidence=0.7,  # Base confidence
-                        source_segment=segment
-                    )
-                    mentions.append(mention)
-        
-        return mentions
+                for match in pattern.finditer(segment.text):
+                    start, end = match.span()
+                    starts.append(start)
+                    ends.append(end)
+                    type_ids.append(type_id)
+                    texts.append(sys.intern(match.group()))
+        
+        return MentionArrays(
+            starts=np.frombuffer(starts, dtype=np.int32),
+            ends=np.frombuffer(ends, dtype=np.int32),
+            type_ids=np.frombuffer(type_ids, dtype=np.int8),
+            texts=texts,
+            entity_types=self.entity_types,
+            source_segment=segment
+        )
     
     def link_entities(self, mentions: List[EntityMention]) -> List[Entity]:
         """
@@ -121,11 +318,18 @@ class EntityLinker:
             List of linked entities
         """
         entities = []
+        # Repeated mentions (e.g. "Congress") are linked once per distinct
+        # (type, text, confidence); callers get their own copy, pointing at
+        # the mention's segment
+        linked = {}
         
         for mention in mentions:
-            entity = self._link_mention(mention)
+            key = (mention.entity_type, mention.text, mention.confidence)
+            if key not in linked:
+                linked[key] = self._link_mention(mention)
+            entity = linked[key]
             if entity:
-                entities.append(entity)
+                entities.append(replace(entity, source_segment=mention.source_segment))
         
         return entities
     
@@ -139,62 +343,85 @@ class EntityLinker:
         Returns:
             Linked entity if found, None otherwise
         """
-        text_lower = mention.text.lower()
-        
-        # Check organizations
-        if mention.entity_type == 'organization':
-            for org_name, org_data in self.known_organizations.items():
-                if org_name in text_lower or text_lower in org_name:
-                    return Entity(
-                        entity_id=org_data['id'],
-                        entity_type=org_data['type'],
-                        name=mention.text,
-                        confidence=mention.confidence,
-                        source_text=mention.text,
-                        external_id=org_data['external_id']
-                    )
-        
-        # Check jurisdictions
-        elif mention.entity_type == 'jurisdiction':
-            for jur_name, jur_data in self.known_jurisdictions.items():
-                if jur_name in text_lower or text_lower in jur_name:
-                    return Entity(
-                        entity_id=jur_data['id'],
-                        entity_type=jur_data['type'],
-                        name=mention.text,
-                        confidence=mention.confidence,
-                        source_text=mention.text,
-                        external_id=jur_data['external_id']
-                    )
-        
-        # For other types, create generic entities
-        else:
-            entity_id = f"{mention.entity_type}_{hash(mention.text) % 10000}"
-            return Entity(
-                entity_id=entity_id,
-                entity_type=mention.entity_type,
-                name=mention.text,
-                confidence=mention.confidence * 0.5,  # Lower confidence for unlinked entities
-                source_text=mention.text
-            )
+        return self._linkers.get(mention.entity_type, self._link_generic)(mention)
+    
+    def _link_organization(self, mention: EntityMention) -> Optional[Entity]:
+        """Link an organization mention through the organization gazetteer."""
+        return self._link_known(mention, self._org_gazetteer)
+    
+    def _link_jurisdiction(self, mention: EntityMention) -> Optional[Entity]:
+        """Link a jurisdiction mention through the jurisdiction gazetteer."""
+        return self._link_known(mention, self._jur_gazetteer)
+    
+    def _link_known(self, mention: EntityMention, gazetteer: _Gazetteer) -> Optional[Entity]:
+        """
+        Link a mention to the known entity a gazetteer returns for it.
         
-        return None
+        Args:
+            mention: Entity mention to link
+            gazetteer: Gazetteer of known entities for the mention's type
+            
+        Returns:
+            Linked entity if found, None otherwise
+        """
+        data = gazetteer.lookup(mention.text.lower())
+        if not data:
+            return None
+        
+        return Entity(
+            entity_id=data['id'],
+            entity_type=data['type'],
+            name=mention.text,
+            confidence=mention.confidence,
+            source_text=mention.text,
+            external_id=data['external_id']
+        )
     
-    def extract_entities_from_claims(self, claims: List[Claim]) -> List[Entity]:
+    def _link_generic(self, mention: EntityMention) -> Entity:
+        """
+        Create a generic entity for a mention with no gazetteer.
+        
+        Args:
+            mention: Entity mention to link
+            
+        Returns:
+            Unlinked entity with a content-derived ID
+        """
+        # Content hash keeps IDs stable across processes, unlike hash()
+        digest = blake2b(mention.text.encode('utf-8'), digest_size=4).hexdigest()
+        entity_id = f"{mention.entity_type}_{digest}"
+        return Entity(
+            entity_id=entity_id,
+            entity_type=mention.entity_type,
+            name=mention.text,
+            confidence=mention.confidence * 0.5,  # Lower confidence for unlinked entities
+            source_text=mention.text
+        )
+    
+    def extract_entities_from_claims(self, claims: List[Claim], n_jobs: int = 1) -> List[Entity]:
         """
         Extract entities from claims.
         
         Args:
             claims: List of claims to analyze
+            n_jobs: Worker processes for pattern matching; 1 runs in-process,
+                -1 uses every core. Linking always runs in this process.
             
         Returns:
             List of entities
         """
         all_entities = []
         
-        for claim in claims:
-            # Extract mentions from claim text
-            mentions = self._extract_mentions_from_text(claim.text, claim.source_segment)
+        if n_jobs != 1 and len(claims) > 1:
+            spans_per_claim = map_in_processes(
+                type(self), '_mention_spans', [(claim.text,) for claim in claims], n_jobs
+            )
+        else:
+            spans_per_claim = [self._mention_spans(claim.text) for claim in claims]
+        
+        for claim, spans in zip(claims, spans_per_claim):
+            # Build mentions from the claim's match spans
+            mentions = self._mentions_from_spans(spans, claim.source_segment)
             
             # Link mentions to entities
             entities = self.link_entities(mentions)
@@ -218,23 +445,49 @@ class EntityLinker:
         Returns:
             List of entity mentions
         """
-        mentions = []
+        return self._mentions_from_spans(self._mention_spans(text), segment)
+    
+    def _mentions_from_spans(self, spans: Tuple[Tuple[str, int, int, str], ...],
+                             segment: DebateSegment) -> List[EntityMention]:
+        """
+        Build entity mentions from match spans.
         
-        for entity_type, patterns in self.entity_patterns.items():
-            for pattern in patterns:
-                matches = re.finditer(pattern, text, re.IGNORECASE)
-                for match in matches:
-                    mention = EntityMention(
-                        text=match.group(),
-                        entity_type=entity_type,
-                        start_pos=match.start(),
-                        end_pos=match.end(),
-                        confidence=0.7,
-                        source_segment=segment
-                    )
-                    mentions.append(mention)
-        
-        return mentions
+        Args:
+            spans: Tuple of (entity_type, start, end, text) per match
+            segment: Source segment
+            
+        Returns:
+            List of entity mentions
+        """
+        return [
+            EntityMention(
+                text=mention_text,
+                entity_type=entity_type,
+                start_pos=start,
+                end_pos=end,
+                confidence=0.7,  # Base confidence
+                source_segment=segment
+            )
+            for entity_type, start, end, mention_text in spans
+        ]
+    
+    def _find_mention_spans(self, text: str) -> Tuple[Tuple[str, int, int, str], ...]:
+        """
+        Find entity matches in text.
+        
+        Args:
+            text: Text to analyze
+            
+        Returns:
+            Tuple of (entity_type, start, end, text) per match
+        """
+        return tuple(
+            # Repeated mentions share one string
+            (entity_type, match.start(), match.end(), sys.intern(match.group()))
+            for entity_type, patterns in self.entity_patterns.items()
+            for pattern in patterns
+            for match in pattern.finditer(text)
+        )
     
     def get_entity_statistics(self, entities: List[Entity]) -> Dict[str, Any]:
         """
@@ -246,30 +499,22 @@ class EntityLinker:
         Returns:
             Dictionary with entity statistics
         """
+        by_type = Counter(entity.entity_type for entity in entities)
+        
+        # Bucket all confidences at once: 0 = low (<= 0.5), 1 = medium, 2 = high (> 0.8)
+        confidences = np.fromiter((entity.confidence for entity in entities), dtype=np.float64, count=len(entities))
+        low, medium, high = np.bincount(np.digitize(confidences, [0.5, 0.8], right=True), minlength=3)
+        
         stats = {
             'total_entities': len(entities),
-            'by_type': {},
+            'by_type': dict(by_type),
             'by_confidence': {
-                'high': 0,    # > 0.8
-                'medium': 0,  # 0.5-0.8
-                'low': 0      # < 0.5
+                'high': int(high),      # > 0.8
+                'medium': int(medium),  # 0.5-0.8
+                'low': int(low)         # < 0.5
             }
         }
         
-        for entity in entities:
-            # Count by type
-            if entity.entity_type not in stats['by_type']:
-                stats['by_type'][entity.entity_type] = 0
-            stats['by_type'][entity.entity_type] += 1
-            
-            # Count by confidence
-            if entity.confidence > 0.8:
-                stats['by_confidence']['high'] += 1
-            elif entity.confidence > 0.5:
-                stats['by_confidence']['medium'] += 1
-            else:
-                stats['by_confidence']['low'] += 1
-        
         return stats
     
     def validate_entity(self, entity: Entity) -> bool:
@@ -306,17 +551,28 @@ class EntityLinker:
         """
         relationships = {}
         
-        # Simple relationship detection based on co-occurrence
-        for i, entity1 in enumerate(entities):
-            if entity1.entity_id not in relationships:
-                relationships[entity1.entity_id] = []
+        # Simple relationship detection based on co-occurrence: bucket entities
+        # by source segment object instead of comparing every pair
+        buckets = {}  # id(segment) -> [(index, entity_id), ...]
+        entity_buckets = []
+        
+        for i, entity in enumerate(entities):
+            if entity.entity_id not in relationships:
+                relationships[entity.entity_id] = []
+            
+            if entity.source_segment is None:
+                entity_buckets.append(None)
+                continue
             
-            for j, entity2 in enumerate(entities):
-                if i != j:
-                    # Check if entities are from the same segment
-                    if hasattr(entity1, 'source_segment') and hasattr(entity2, 'source_segment'):
-                        if entity1.source_segment == entity2.source_segment:
-                            relationships[entity1.entity_id].append(entity2.entity_id)
+            bucket = buckets.setdefault(id(entity.source_segment), [])
+            bucket.append((i, entity.entity_id))
+            entity_buckets.append(bucket)
+        
+        for i, (entity, bucket) in enumerate(zip(entities, entity_buckets)):
+            if bucket is not None:
+                relationships[entity.entity_id].extend(
+                    other_id for j, other_id in bucket if j != i
+                )
         
         return relationships
 
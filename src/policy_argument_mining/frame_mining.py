@@ -5,17 +5,85 @@ This module detects narrative frames and themes in policy discourse,
 such as economic growth, public safety, consumer protection, etc.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Mapping, Optional, Pattern, Tuple
 from dataclasses import dataclass
+from types import MappingProxyType
 from .ingestion import DebateSegment
 from .claim_detection import Claim
+from ._util import DATACLASS_SLOTS, map_in_processes
+from ._frame_kernels import score_patterns
+import functools
+import heapq
 import re
 import logging
+import numpy as np
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+    pc = None
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 logger = logging.getLogger(__name__)
 
+# Frame patterns of the form \b(kw1|kw2|...)\b, where keywords may use \s+ between words
+_KEYWORD_GROUP_RE = re.compile(r'^\\b\(([a-z|]+(?:\\s\+[a-z|]+)*)\)\\b$')
+
+
+# Related frames are fixed, so the mapping is built once and shared read-only
+_FRAME_RELATIONSHIPS = MappingProxyType({
+    'economic_growth': ('innovation', 'fiscal_responsibility'),
+    'public_safety': ('national_security', 'consumer_protection'),
+    'consumer_protection': ('public_safety', 'social_justice'),
+    'innovation': ('economic_growth', 'education'),
+    'national_security': ('public_safety', 'cybersecurity'),
+    'climate_risk': ('health_care', 'social_justice'),
+    'health_care': ('social_justice', 'education'),
+    'education': ('innovation', 'social_justice'),
+    'social_justice': ('health_care', 'consumer_protection'),
+    'fiscal_responsibility': ('economic_growth', 'public_safety'),
+})
+
+
+def _literal_keywords(pattern: str) -> Optional[List[str]]:
+    """Return the literal alternatives of a keyword pattern, or None if it is not one."""
+    match = _KEYWORD_GROUP_RE.match(pattern)
+    if not match:
+        return None
+    return [kw.replace(r'\s+', ' ') for kw in match.group(1).split('|')]
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == '_'
+
+
+def _is_word_byte_at(data: bytes, pos: int) -> bool:
+    """Whether the UTF-8 character starting at or containing byte ``pos`` is a word character."""
+    if pos < 0 or pos >= len(data):
+        return False
+    if data[pos] < 0x80:
+        return _is_word_char(chr(data[pos]))
+    start = pos
+    while start > 0 and data[start] & 0xC0 == 0x80:
+        start -= 1
+    end = pos + 1
+    while end < len(data) and data[end] & 0xC0 == 0x80:
+        end += 1
+    return _is_word_char(data[start:end].decode('utf-8', errors='ignore')[:1] or ' ')
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class Frame:
     """Represents a detected narrative frame in policy discourse."""
     frame_label: str
@@ -28,7 +96,7 @@ class FrameMiner:
     """Detects narrative frames in policy documents and debate segments."""
     
     def __init__(self):
-        self.frame_patterns = {
+        frame_patterns = {
             'economic_growth': [
                 r'\b(economic\s+growth|economic\s+development|prosperity|wealth)\b',
                 r'\b(jobs|employment|unemployment|workforce|labor)\b',
@@ -90,6 +158,161 @@ class FrameMiner:
                 r'\b(balanced\s+budget|deficit\s+reduction)\b',
             ]
         }
+        
+        # Patterns are lowercase and always matched against lowercased text,
+        # so they are compiled without IGNORECASE
+        self.frame_patterns = {
+            frame_label: [re.compile(p) for p in patterns]
+            for frame_label, patterns in frame_patterns.items()
+        }
+        
+        # Optional backends that score every frame in one pass over the text:
+        # hyperscan if installed, otherwise an Aho-Corasick automaton
+        self._hs_db = None
+        self._hs_targets = []
+        self._automaton = None
+        keyword_targets = self._keyword_targets()
+        if keyword_targets is not None:
+            if hyperscan is not None:
+                self._build_hyperscan_db(keyword_targets)
+            if self._hs_db is None and ahocorasick is not None:
+                self._automaton = self._build_automaton(keyword_targets)
+        
+        # Repeated texts (reruns, quoted passages) reuse their frame scores
+        self._segment_frame_scores = functools.lru_cache(maxsize=4096)(self._score_segment_text)
+    
+    def _keyword_targets(self) -> Optional[List[tuple]]:
+        """List (frame_label, pattern_idx, alt_idx, keyword) for every frame keyword."""
+        targets = []
+        for frame_label, patterns in self.frame_patterns.items():
+            for pattern_idx, pattern in enumerate(patterns):
+                keywords = _literal_keywords(pattern.pattern)
+                if keywords is None:
+                    logger.warning(f"Falling back to re for frame pattern: {pattern.pattern}")
+                    return None
+                for alt_idx, keyword in enumerate(keywords):
+                    targets.append((frame_label, pattern_idx, alt_idx, keyword))
+        return targets
+    
+    def _build_hyperscan_db(self, keyword_targets: List[tuple]) -> None:
+        """Compile every frame keyword into one hyperscan database."""
+        # Hyperscan's \b is ASCII-only, so word boundaries are checked in Python
+        expressions = [
+            keyword.replace(' ', r'\s+').encode('utf-8')
+            for _, _, _, keyword in keyword_targets
+        ]
+        # Start offsets are needed to replay per-pattern non-overlapping matching;
+        # UCP makes \s match Unicode whitespace such as U+00A0, as re does
+        flags = hyperscan.HS_FLAG_SOM_LEFTMOST | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+        
+        try:
+            db = hyperscan.Database()
+            db.compile(
+                expressions=expressions,
+                ids=list(range(len(expressions))),
+                elements=len(expressions),
+                flags=[flags] * len(expressions)
+            )
+            self._hs_db = db
+            self._hs_targets = [target[:3] for target in keyword_targets]
+        except Exception as e:
+            logger.warning(f"Hyperscan unavailable for frame patterns: {e}")
+            self._hs_db = None
+    
+    def _build_automaton(self, keyword_targets: List[tuple]):
+        """Build an Aho-Corasick automaton over all frame keywords."""
+        targets = {}
+        for frame_label, pattern_idx, alt_idx, keyword in keyword_targets:
+            targets.setdefault(keyword, []).append((frame_label, pattern_idx, alt_idx))
+        
+        automaton = ahocorasick.Automaton()
+        for keyword, targets_for_keyword in targets.items():
+            automaton.add_word(keyword, (keyword, tuple(targets_for_keyword)))
+        automaton.make_automaton()
+        
+        return automaton
+    
+    def _collect_hits_hyperscan(self, text_lower: str) -> Dict[tuple, list]:
+        """Collect keyword hits per (frame_label, pattern_idx) with hyperscan."""
+        data = text_lower.encode('utf-8')
+        hits = {}
+        
+        def on_match(expr_id, start, end, flags, context):
+            if _is_word_byte_at(data, start - 1) or _is_word_byte_at(data, end):
+                return
+            frame_label, pattern_idx, alt_idx = self._hs_targets[expr_id]
+            hits.setdefault((frame_label, pattern_idx), []).append((start, alt_idx, end, data[start:end]))
+        
+        self._hs_db.scan(data, match_event_handler=on_match)
+        
+        for pattern_hits in hits.values():
+            pattern_hits[:] = [(start, alt_idx, end, raw.decode('utf-8')) for start, alt_idx, end, raw in pattern_hits]
+        
+        return hits
+    
+    def _collect_hits_automaton(self, text_lower: str) -> Dict[tuple, list]:
+        """Collect keyword hits per (frame_label, pattern_idx) with Aho-Corasick."""
+        # \s+ in the patterns matches any whitespace run
+        text = ' '.join(text_lower.split())
+        hits = {}
+        
+        for end_idx, (keyword, keyword_targets) in self._automaton.iter(text):
+            start = end_idx - len(keyword) + 1
+            end = end_idx + 1
+            if start > 0 and _is_word_char(text[start - 1]):
+                continue
+            if end < len(text) and _is_word_char(text[end]):
+                continue
+            for frame_label, pattern_idx, alt_idx in keyword_targets:
+                hits.setdefault((frame_label, pattern_idx), []).append((start, alt_idx, end, keyword))
+        
+        return hits
+    
+    def _has_scan_backend(self) -> bool:
+        return self._hs_db is not None or self._automaton is not None
+    
+    def _scan_frames(self, text_lower: str) -> Dict[str, Any]:
+        """
+        Score every frame with a single pass of the scan backend.
+        
+        Mirrors the per-pattern regex scoring: each pattern counts its
+        non-overlapping, word-bounded matches (earlier alternatives win at the
+        same position) and evidence is the first match of the first pattern hit.
+        
+        Args:
+            text_lower: Lowercased text to scan
+            
+        Returns:
+            Dictionary mapping frame labels to (confidence, evidence_text)
+        """
+        if self._hs_db is not None:
+            hits = self._collect_hits_hyperscan(text_lower)
+        else:
+            hits = self._collect_hits_automaton(text_lower)
+        
+        scores = {}
+        for frame_label, patterns in self.frame_patterns.items():
+            confidence = 0.0
+            evidence_text = ""
+            for pattern_idx in range(len(patterns)):
+                pattern_hits = hits.get((frame_label, pattern_idx))
+                if not pattern_hits:
+                    continue
+                pattern_hits.sort()
+                count = 0
+                pos = 0
+                for start, _, end, matched in pattern_hits:
+                    if start < pos:
+                        continue
+                    if not evidence_text:
+                        evidence_text = matched
+                    count += 1
+                    pos = end
+                confidence += count * 0.2
+            if confidence:
+                scores[frame_label] = (confidence, evidence_text)
+        
+        return scores
     
     def detect_frames(self, segment: DebateSegment) -> List[Frame]:
         """
@@ -101,103 +324,167 @@ class FrameMiner:
         Returns:
             List of detected frames
         """
-        frames = []
+        return [
+            Frame(
+                frame_label=frame_label,
+                confidence=confidence,
+                evidence_text=evidence_text,
+                source_segment=segment
+            )
+            for frame_label, confidence, evidence_text in self._segment_frame_scores(segment.text)
+        ]
+    
+    def _score_segment_text(self, text: str) -> Tuple[Tuple[str, float, str], ...]:
+        """
+        Score every frame for a segment's text.
         
-        # Check each frame pattern
-        for frame_label, patterns in self.frame_patterns.items():
-            frame = self._detect_frame_in_text(segment, frame_label, patterns)
-            if frame:
-                frames.append(frame)
+        Args:
+            text: Segment text
+            
+        Returns:
+            Tuple of (frame_label, confidence, evidence_text) for each frame
+            above the detection threshold
+        """
+        # Lowercase once per segment rather than once per frame
+        text_lower = text.lower()
         
-        return frames
+        if self._has_scan_backend():
+            scores = self._scan_frames(text_lower).items()
+        else:
+            scores = (
+                (frame_label, score_patterns(text_lower, patterns))
+                for frame_label, patterns in self.frame_patterns.items()
+            )
+        
+        return tuple(
+            (frame_label, min(1.0, confidence), evidence_text)
+            for frame_label, (confidence, evidence_text) in scores
+            if confidence > 0.2  # Threshold for frame detection
+        )
     
-    def detect_frames_from_claims(self, claims: List[Claim]) -> List[Frame]:
+    def detect_frames_batch(self, segments: List[DebateSegment]) -> List[Frame]:
         """
-        Detect frames from claims.
+        Detect frames in multiple segments.
+        
+        With pyarrow installed, each pattern is counted across all ASCII
+        segments in one vectorized call instead of once per segment. Its RE2
+        engine has ASCII-only word boundaries, so other segments go through
+        ``detect_frames``.
         
         Args:
-            claims: List of claims to analyze
+            segments: List of debate segments
             
         Returns:
-            List of detected frames
+            List of detected frames, in segment order
         """
-        frames = []
+        ascii_indices = [i for i, segment in enumerate(segments) if segment.text.isascii()]
+        if pa is None or not ascii_indices:
+            all_frames = []
+            for segment in segments:
+                all_frames.extend(self.detect_frames(segment))
+            return all_frames
         
-        for claim in claims:
-            for frame_label, patterns in self.frame_patterns.items():
-                frame = self._detect_frame_in_claim(claim, frame_label, patterns)
-                if frame:
-                    frames.append(frame)
+        texts = pc.utf8_lower(pa.array([segments[i].text for i in ascii_indices], type=pa.string()))
+        n = len(ascii_indices)
+        scores = {}
         
-        return frames
+        for frame_label, patterns in self.frame_patterns.items():
+            confidence = np.zeros(n)
+            evidence = [""] * n
+            for pattern in patterns:
+                # RE2's \s leaves out \v and \x1c-\x1f, which re counts as whitespace
+                re2_pattern = pattern.pattern.replace(r'\s', r'[\t\n\v\f\r \x1c-\x1f]')
+                counts = pc.count_substring_regex(texts, re2_pattern).to_numpy(zero_copy_only=False)
+                if not counts.any():
+                    continue
+                confidence += counts * 0.2
+                # Evidence is the first match of the first pattern that hits
+                needed = [i for i in np.flatnonzero(counts) if not evidence[i]]
+                if needed:
+                    # extract_regex only accepts named groups
+                    named = '(?P<m>' + re.sub(r'(?<!\\)\((?!\?)', '(?:', re2_pattern) + ')'
+                    matched = pc.extract_regex(texts.take(pa.array(needed)), named)
+                    for i, text in zip(needed, matched.field('m').to_pylist()):
+                        evidence[i] = text
+            scores[frame_label] = (confidence, evidence)
+        
+        frames_per_segment: List[List[Frame]] = [[] for _ in segments]
+        for row, i in enumerate(ascii_indices):
+            for frame_label, (confidence, evidence) in scores.items():
+                if confidence[row] > 0.2:  # Threshold for frame detection
+                    frames_per_segment[i].append(Frame(
+                        frame_label=frame_label,
+                        confidence=min(1.0, float(confidence[row])),
+                        evidence_text=evidence[row],
+                        source_segment=segments[i]
+                    ))
+        
+        ascii_set = set(ascii_indices)
+        for i, segment in enumerate(segments):
+            if i not in ascii_set:
+                frames_per_segment[i] = self.detect_frames(segment)
+        
+        return [frame for frames in frames_per_segment for frame in frames]
     
-    def _detect_frame_in_text(self, segment: DebateSegment, frame_label: str, patterns: List[str]) -> Optional[Frame]:
+    def detect_frames_from_claims(self, claims: List[Claim], n_jobs: int = 1) -> List[Frame]:
         """
-        Detect a specific frame in text.
+        Detect frames from claims.
         
         Args:
-            segment: Debate segment
-            frame_label: Frame label
-            patterns: Patterns to match
+            claims: List of claims to analyze
+            n_jobs: Worker processes for scoring; 1 runs in-process, -1 uses
+                every core
             
         Returns:
-            Frame if detected, None otherwise
+            List of detected frames
         """
-        text_lower = segment.text.lower()
-        confidence = 0.0
-        evidence_text = ""
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, text_lower, re.IGNORECASE)
-            if matches:
-                confidence += len(matches) * 0.2
-                # Use the first match as evidence
-                if not evidence_text:
-                    evidence_text = matches[0]
-        
-        if confidence > 0.2:  # Threshold for frame detection
-            return Frame(
-                frame_label=frame_label,
-                confidence=min(1.0, confidence),
-                evidence_text=evidence_text,
-                source_segment=segment
-            )
+        calls = [(claim.text, claim.confidence) for claim in claims]
+        if n_jobs != 1 and len(claims) > 1:
+            scores_per_claim = map_in_processes(type(self), '_score_claim_text', calls, n_jobs)
+        else:
+            scores_per_claim = [self._score_claim_text(text, weight) for text, weight in calls]
         
-        return None
+        frames = []
+        
+        for claim, scores in zip(claims, scores_per_claim):
+            for frame_label, confidence, evidence_text in scores:
+                frames.append(Frame(
+                    frame_label=frame_label,
+                    confidence=confidence,
+                    evidence_text=evidence_text,
+                    source_segment=claim.source_segment
+                ))
+        
+        return frames
     
-    def _detect_frame_in_claim(self, claim: Claim, frame_label: str, patterns: List[str]) -> Optional[Frame]:
+    def _score_claim_text(self, text: str, weight: float) -> Tuple[Tuple[str, float, str], ...]:
         """
-        Detect a specific frame in a claim.
+        Score every frame for a claim's text.
         
         Args:
-            claim: Claim to analyze
-            frame_label: Frame label
-            patterns: Patterns to match
+            text: Claim text
+            weight: Claim confidence the frame confidence is scaled by
             
         Returns:
-            Frame if detected, None otherwise
+            Tuple of (frame_label, weighted confidence, evidence_text) for each
+            frame above the claim threshold
         """
-        text_lower = claim.text.lower()
-        confidence = 0.0
-        evidence_text = ""
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, text_lower, re.IGNORECASE)
-            if matches:
-                confidence += len(matches) * 0.2
-                # Use the first match as evidence
-                if not evidence_text:
-                    evidence_text = matches[0]
-        
-        if confidence > 0.15:  # Lower threshold for claims
-            return Frame(
-                frame_label=frame_label,
-                confidence=min(1.0, confidence * claim.confidence),  # Weight by claim confidence
-                evidence_text=evidence_text,
-                source_segment=claim.source_segment
+        text_lower = text.lower()
+        
+        if self._has_scan_backend():
+            scores = self._scan_frames(text_lower).items()
+        else:
+            # The weighted confidence is capped at 1.0, so stop once that is certain
+            scores = (
+                (frame_label, score_patterns(text_lower, patterns, weight))
+                for frame_label, patterns in self.frame_patterns.items()
             )
         
-        return None
+        return tuple(
+            (frame_label, min(1.0, confidence * weight), evidence_text)  # Weight by claim confidence
+            for frame_label, (confidence, evidence_text) in scores
+            if confidence > 0.15  # Lower threshold for claims
+        )
     
     def get_frame_distribution(self, frames: List[Frame]) -> Dict[str, int]:
         """
@@ -229,9 +516,8 @@ class FrameMiner:
         Returns:
             List of dominant frames
         """
-        # Sort by confidence and return top k
-        sorted_frames = sorted(frames, key=lambda x: x.confidence, reverse=True)
-        return sorted_frames[:top_k]
+        # Select the top k by confidence without sorting the whole list
+        return heapq.nlargest(top_k, frames, key=lambda x: x.confidence)
     
     def validate_frame(self, frame: Frame) -> bool:
         """
@@ -256,7 +542,7 @@ class FrameMiner:
         
         return True
     
-    def get_frame_relationships(self, frames: List[Frame]) -> Dict[str, List[str]]:
+    def get_frame_relationships(self, frames: List[Frame]) -> Mapping[str, Tuple[str, ...]]:
         """
         Get relationships between frames.
         
@@ -264,22 +550,9 @@ class FrameMiner:
             frames: List of frames
             
         Returns:
-            Dictionary mapping frames to related frames
+            Read-only mapping from frames to related frames
         """
-        relationships = {
-            'economic_growth': ['innovation', 'fiscal_responsibility'],
-            'public_safety': ['national_security', 'consumer_protection'],
-            'consumer_protection': ['public_safety', 'social_justice'],
-            'innovation': ['economic_growth', 'education'],
-            'national_security': ['public_safety', 'cybersecurity'],
-            'climate_risk': ['health_care', 'social_justice'],
-            'health_care': ['social_justice', 'education'],
-            'education': ['innovation', 'social_justice'],
-            'social_justice': ['health_care', 'consumer_protection'],
-            'fiscal_responsibility': ['economic_growth', 'public_safety']
-        }
-        
-        return relationships
+        return _FRAME_RELATIONSHIPS
 
 
 
@@ -5,35 +5,63 @@ This module builds and manages argument graphs from policy debates,
 connecting arguments, stances, and entities.
 """
 
-from typing import List, Dict, Any, Optional, Set
+from typing import List, Dict, Any, Optional, Set, Tuple
 from dataclasses import dataclass
+from itertools import islice
+import json
 from .ingestion import DebateSegment
+from ._util import DATACLASS_SLOTS
 from .claim_detection import Claim
 from .stance_detection import Stance
 from .argument_role_labeling import ArgumentRole
 from .frame_mining import Frame
 from .entity_linking import Entity
+from scipy import sparse
+from sklearn.feature_extraction.text import CountVectorizer
 import networkx as nx
+import numpy as np
 import logging
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import rustworkx as rx
+except ImportError:
+    rx = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to UTF-8 JSON: orjson when installed, stdlib json otherwise."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj).encode('utf-8')
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ArgumentNode:
     """Represents a node in the argument graph."""
-    node_id: str
+    node_id: int
     node_type: str  # claim, stance, entity, frame
     content: Any  # Claim, Stance, Entity, or Frame object
     confidence: float
     source_segment: DebateSegment
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ArgumentEdge:
     """Represents an edge in the argument graph."""
-    from_node_id: str
-    to_node_id: str
+    from_node_id: int
+    to_node_id: int
     relation: str  # supports, attacks, rebuts, undercuts, mentions, frames
     confidence: float
     evidence: str
@@ -43,12 +71,20 @@ class ArgumentGraph:
     """Builds and manages argument graphs from policy debates."""
     
     def __init__(self):
+        # networkx holds the structure; each node/edge carries only a 'ref'
+        # attribute pointing at its ArgumentNode/ArgumentEdge
         self.graph = nx.DiGraph()
-        self.nodes: Dict[str, ArgumentNode] = {}
+        # Node IDs are integers internally; export_to_dict renders them as '<type>_<id>'
+        self.nodes: Dict[int, ArgumentNode] = {}
         self.edges: List[ArgumentEdge] = []
+        # (from, to, relation) of every edge in self.edges, so repeats are skipped
+        self._edge_keys: Set[Tuple[int, int, str]] = set()
         self.node_counter = 0
+        # While True, add_* and add_edge only record nodes/edges; networkx is
+        # filled in bulk by _flush_to_networkx
+        self._defer_networkx = False
     
-    def add_claim(self, claim: Claim) -> str:
+    def add_claim(self, claim: Claim) -> int:
         """
         Add a claim to the graph.
         
@@ -56,9 +92,9 @@ class ArgumentGraph:
             claim: Claim to add
             
         Returns:
-            Node ID of the added claim
+            Integer node ID of the added claim ('claim_<id>' in ``export_to_dict``)
         """
-        node_id = f"claim_{self.node_counter}"
+        node_id = self.node_counter
         self.node_counter += 1
         
         node = ArgumentNode(
@@ -70,11 +106,12 @@ class ArgumentGraph:
         )
         
         self.nodes[node_id] = node
-        self.graph.add_node(node_id, **node.__dict__)
+        if not self._defer_networkx:
+            self.graph.add_node(node_id, ref=node)
         
         return node_id
     
-    def add_stance(self, stance: Stance) -> str:
+    def add_stance(self, stance: Stance) -> int:
         """
         Add a stance to the graph.
         
@@ -82,9 +119,9 @@ class ArgumentGraph:
             stance: Stance to add
             
         Returns:
-            Node ID of the added stance
+            Integer node ID of the added stance ('stance_<id>' in ``export_to_dict``)
         """
-        node_id = f"stance_{self.node_counter}"
+        node_id = self.node_counter
         self.node_counter += 1
         
         node = ArgumentNode(
@@ -96,11 +133,12 @@ class ArgumentGraph:
         )
         
         self.nodes[node_id] = node
-        self.graph.add_node(node_id, **node.__dict__)
+        if not self._defer_networkx:
+            self.graph.add_node(node_id, ref=node)
         
         return node_id
     
-    def add_entity(self, entity: Entity) -> str:
+    def add_entity(self, entity: Entity) -> int:
         """
         Add an entity to the graph.
         
@@ -108,9 +146,9 @@ class ArgumentGraph:
             entity: Entity to add
             
         Returns:
-            Node ID of the added entity
+            Integer node ID of the added entity ('entity_<id>' in ``export_to_dict``)
         """
-        node_id = f"entity_{self.node_counter}"
+        node_id = self.node_counter
         self.node_counter += 1
         
         node = ArgumentNode(
@@ -122,11 +160,12 @@ class ArgumentGraph:
         )
         
         self.nodes[node_id] = node
-        self.graph.add_node(node_id, **node.__dict__)
+        if not self._defer_networkx:
+            self.graph.add_node(node_id, ref=node)
         
         return node_id
     
-    def add_frame(self, frame: Frame) -> str:
+    def add_frame(self, frame: Frame) -> int:
         """
         Add a frame to the graph.
         
@@ -134,9 +173,9 @@ class ArgumentGraph:
             frame: Frame to add
             
         Returns:
-            Node ID of the added frame
+            Integer node ID of the added frame ('frame_<id>' in ``export_to_dict``)
         """
-        node_id = f"frame_{self.node_counter}"
+        node_id = self.node_counter
         self.node_counter += 1
         
         node = ArgumentNode(
@@ -148,14 +187,18 @@ class ArgumentGraph:
         )
         
         self.nodes[node_id] = node
-        self.graph.add_node(node_id, **node.__dict__)
+        if not self._defer_networkx:
+            self.graph.add_node(node_id, ref=node)
         
         return node_id
     
-    def add_edge(self, from_node_id: str, to_node_id: str, relation: str, confidence: float = 0.5, evidence: str = "") -> None:
+    def add_edge(self, from_node_id: int, to_node_id: int, relation: str, confidence: float = 0.5, evidence: str = "") -> None:
         """
         Add an edge to the graph.
         
+        An edge with the same endpoints and relation as an existing one is
+        ignored; the first one added is kept.
+        
         Args:
             from_node_id: Source node ID
             to_node_id: Target node ID
@@ -167,6 +210,11 @@ class ArgumentGraph:
             logger.warning(f"Attempting to add edge between non-existent nodes: {from_node_id} -> {to_node_id}")
             return
         
+        key = (from_node_id, to_node_id, relation)
+        if key in self._edge_keys:
+            return
+        self._edge_keys.add(key)
+        
         edge = ArgumentEdge(
             from_node_id=from_node_id,
             to_node_id=to_node_id,
@@ -176,7 +224,8 @@ class ArgumentGraph:
         )
         
         self.edges.append(edge)
-        self.graph.add_edge(from_node_id, to_node_id, **edge.__dict__)
+        if not self._defer_networkx:
+            self.graph.add_edge(from_node_id, to_node_id, ref=edge)
     
     def build_graph_from_segments(self, segments: List[DebateSegment], claims: List[Claim], 
                                  stances: List[Stance], entities: List[Entity], frames: List[Frame]) -> None:
@@ -190,68 +239,163 @@ class ArgumentGraph:
             entities: List of entities
             frames: List of frames
         """
-        # Add all nodes
-        claim_nodes = {}
-        stance_nodes = {}
-        entity_nodes = {}
-        frame_nodes = {}
-        
-        for claim in claims:
-            node_id = self.add_claim(claim)
-            claim_nodes[claim] = node_id
-        
-        for stance in stances:
-            node_id = self.add_stance(stance)
-            stance_nodes[stance] = node_id
-        
-        for entity in entities:
-            node_id = self.add_entity(entity)
-            entity_nodes[entity] = node_id
-        
-        for frame in frames:
-            node_id = self.add_frame(frame)
-            frame_nodes[frame] = node_id
-        
-        # Add edges based on relationships
-        self._add_claim_stance_edges(claim_nodes, stance_nodes)
-        self._add_entity_mention_edges(claim_nodes, entity_nodes)
-        self._add_frame_edges(claim_nodes, frame_nodes)
-        self._add_argument_edges(claim_nodes)
+        # Record everything first and hand it to networkx in two bulk calls
+        first_node = len(self.nodes)
+        first_edge = len(self.edges)
+        self._defer_networkx = True
+        try:
+            # Add all nodes, keeping node IDs in lists parallel to the inputs
+            claim_ids = [self.add_claim(claim) for claim in claims]
+            stance_ids = [self.add_stance(stance) for stance in stances]
+            entity_ids = [self.add_entity(entity) for entity in entities]
+            frame_ids = [self.add_frame(frame) for frame in frames]
+            
+            # Add edges based on relationships; claim text is lowercased once for all passes
+            claims_lower = [claim.text.lower() for claim in claims]
+            self._add_claim_stance_edges(claims_lower, claim_ids, stances, stance_ids)
+            self._add_entity_mention_edges(claims_lower, claim_ids, entities, entity_ids)
+            self._add_frame_edges(claims_lower, claim_ids, frames, frame_ids)
+            self._add_argument_edges(claims_lower, claim_ids)
+        finally:
+            self._defer_networkx = False
+            self._flush_to_networkx(first_node, first_edge)
     
-    def _add_claim_stance_edges(self, claim_nodes: Dict[Claim, str], stance_nodes: Dict[Stance, str]) -> None:
+    def _flush_to_networkx(self, first_node: int, first_edge: int) -> None:
+        """
+        Add nodes and edges recorded since the given positions to networkx.
+        
+        Args:
+            first_node: Index into ``self.nodes`` of the first unsynced node
+            first_edge: Index into ``self.edges`` of the first unsynced edge
+        """
+        self.graph.add_nodes_from(
+            (node.node_id, {'ref': node}) for node in islice(self.nodes.values(), first_node, None)
+        )
+        self.graph.add_edges_from(
+            (edge.from_node_id, edge.to_node_id, {'ref': edge}) for edge in islice(self.edges, first_edge, None)
+        )
+    
+    def _add_claim_stance_edges(self, claims_lower: List[str], claim_ids: List[int],
+                                stances: List[Stance], stance_ids: List[int]) -> None:
         """Add edges between claims and stances."""
-        for claim, claim_id in claim_nodes.items():
-            for stance, stance_id in stance_nodes.items():
-                # Check if stance is about the same target as claim
-                if stance.stance_target.lower() in claim.text.lower():
-                    relation = "supports" if stance.stance_label == "support" else "attacks"
-                    self.add_edge(claim_id, stance_id, relation, stance.confidence, stance.evidence_text)
+        # Check if stance is about the same target as claim
+        hits = self._contained_needles(claims_lower, [stance.stance_target for stance in stances])
+        for claim_id, stance_indices in zip(claim_ids, hits):
+            for k in stance_indices:
+                stance = stances[k]
+                relation = "supports" if stance.stance_label == "support" else "attacks"
+                self.add_edge(claim_id, stance_ids[k], relation, stance.confidence, stance.evidence_text)
     
-    def _add_entity_mention_edges(self, claim_nodes: Dict[Claim, str], entity_nodes: Dict[Entity, str]) -> None:
+    def _add_entity_mention_edges(self, claims_lower: List[str], claim_ids: List[int],
+                                  entities: List[Entity], entity_ids: List[int]) -> None:
         """Add edges between claims and entities they mention."""
-        for claim, claim_id in claim_nodes.items():
-            for entity, entity_id in entity_nodes.items():
-                if entity.name.lower() in claim.text.lower():
-                    self.add_edge(claim_id, entity_id, "mentions", entity.confidence, entity.source_text)
+        hits = self._contained_needles(claims_lower, [entity.name for entity in entities])
+        for claim_id, entity_indices in zip(claim_ids, hits):
+            for k in entity_indices:
+                entity = entities[k]
+                self.add_edge(claim_id, entity_ids[k], "mentions", entity.confidence, entity.source_text)
     
-    def _add_frame_edges(self, claim_nodes: Dict[Claim, str], frame_nodes: Dict[Frame, str]) -> None:
+    def _add_frame_edges(self, claims_lower: List[str], claim_ids: List[int],
+                         frames: List[Frame], frame_ids: List[int]) -> None:
         """Add edges between claims and frames."""
-        for claim, claim_id in claim_nodes.items():
-            for frame, frame_id in frame_nodes.items():
-                if frame.evidence_text.lower() in claim.text.lower():
-                    self.add_edge(claim_id, frame_id, "frames", frame.confidence, frame.evidence_text)
+        hits = self._contained_needles(claims_lower, [frame.evidence_text for frame in frames])
+        for claim_id, frame_indices in zip(claim_ids, hits):
+            for k in frame_indices:
+                frame = frames[k]
+                self.add_edge(claim_id, frame_ids[k], "frames", frame.confidence, frame.evidence_text)
     
-    def _add_argument_edges(self, claim_nodes: Dict[Claim, str]) -> None:
+    def _contained_needles(self, claims_lower: List[str], needles: List[str]) -> List[List[int]]:
+        """
+        Find which needles occur in each claim, ignoring case.
+        
+        Equivalent to testing ``needle.lower() in claim.text.lower()`` for
+        every pair, but with pyahocorasick installed each claim is scanned
+        once for all needles.
+        
+        Args:
+            claims_lower: Lowercased claim texts
+            needles: Strings to look for
+            
+        Returns:
+            For each claim, the indices of the needles it contains, ascending
+        """
+        needles_lower = [needle.lower() for needle in needles]
+        
+        if ahocorasick is None:
+            return [
+                [k for k, needle in enumerate(needles_lower) if needle in text]
+                for text in claims_lower
+            ]
+        
+        # The empty string is contained in every claim but cannot go in the automaton
+        always = [k for k, needle in enumerate(needles_lower) if not needle]
+        indices_by_needle = {}
+        for k, needle in enumerate(needles_lower):
+            if needle:
+                indices_by_needle.setdefault(needle, []).append(k)
+        if not indices_by_needle:
+            return [list(always) for _ in claims_lower]
+        
+        automaton = ahocorasick.Automaton()
+        for needle, indices in indices_by_needle.items():
+            automaton.add_word(needle, indices)
+        automaton.make_automaton()
+        
+        hits = []
+        for text in claims_lower:
+            found = set(always)
+            for _, indices in automaton.iter(text):
+                found.update(indices)
+            hits.append(sorted(found))
+        
+        return hits
+    
+    def _add_argument_edges(self, claims_lower: List[str], claim_ids: List[int]) -> None:
         """Add edges between related claims."""
-        claims = list(claim_nodes.keys())
-        
-        for i, claim1 in enumerate(claims):
-            for j, claim2 in enumerate(claims[i+1:], i+1):
-                # Check for semantic similarity (simple keyword overlap)
-                similarity = self._calculate_similarity(claim1.text, claim2.text)
-                if similarity > 0.3:
-                    relation = "supports" if similarity > 0.6 else "related"
-                    self.add_edge(claim_nodes[claim1], claim_nodes[claim2], relation, similarity, "semantic similarity")
+        # Check for semantic similarity (simple keyword overlap) across all pairs at once
+        rows, cols, similarities = self._similar_claim_pairs(claims_lower, 0.3)
+        for i, j, similarity in zip(rows, cols, similarities):
+            relation = "supports" if similarity > 0.6 else "related"
+            self.add_edge(claim_ids[i], claim_ids[j], relation, float(similarity), "semantic similarity")
+    
+    def _similar_claim_pairs(self, texts_lower: List[str], threshold: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Find text pairs whose word-set Jaccard similarity exceeds a threshold.
+        
+        Computes the same similarity as ``_calculate_similarity`` for every
+        pair i < j, using a binary bag-of-words matrix: intersections come
+        from one sparse product and unions from the row sums. Only pairs that
+        share a word are materialized.
+        
+        Args:
+            texts_lower: Lowercased texts to compare
+            threshold: Pairs with similarity above this are returned
+            
+        Returns:
+            Tuple of (rows, cols, similarities), ordered by row then column
+        """
+        empty = (np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty(0))
+        if len(texts_lower) < 2:
+            return empty
+        
+        # Same tokens as text.lower().split()
+        vectorizer = CountVectorizer(binary=True, lowercase=False, tokenizer=str.split, token_pattern=None)
+        try:
+            X = vectorizer.fit_transform(texts_lower)
+        except ValueError:  # No words in any text
+            return empty
+        
+        sizes = np.asarray(X.sum(axis=1)).ravel()
+        overlap = sparse.triu(X @ X.T, k=1).tocoo()
+        
+        rows, cols, intersection = overlap.row, overlap.col, overlap.data
+        similarities = intersection / (sizes[rows] + sizes[cols] - intersection)
+        
+        keep = similarities > threshold
+        rows, cols, similarities = rows[keep], cols[keep], similarities[keep]
+        order = np.lexsort((cols, rows))
+        
+        return rows[order], cols[order], similarities[order]
     
     def _calculate_similarity(self, text1: str, text2: str) -> float:
         """Calculate simple similarity between two texts."""
@@ -266,10 +410,18 @@ class ArgumentGraph:
         
         return len(intersection) / len(union)
     
-    def get_graph_statistics(self) -> Dict[str, Any]:
+    def get_graph_statistics(self, include_topology: bool = False) -> Dict[str, Any]:
         """
         Get statistics about the argument graph.
         
+        Node and edge counts are always included. The topology fields
+        (``connected_components``, ``density``, ``average_clustering``) run
+        graph algorithms, and clustering copies the graph to an undirected
+        one, so they are only computed on request.
+        
+        Args:
+            include_topology: Whether to add the topology fields
+            
         Returns:
             Dictionary with graph statistics
         """
@@ -277,12 +429,14 @@ class ArgumentGraph:
             'total_nodes': len(self.nodes),
             'total_edges': len(self.edges),
             'node_types': {},
-            'edge_types': {},
-            'connected_components': nx.number_strongly_connected_components(self.graph),
-            'density': nx.density(self.graph),
-            'average_clustering': nx.average_clustering(self.graph.to_undirected()) if self.graph.nodes() else 0
+            'edge_types': {}
         }
         
+        if include_topology:
+            stats['connected_components'] = self._count_strongly_connected_components()
+            stats['density'] = nx.density(self.graph)
+            stats['average_clustering'] = nx.average_clustering(self.graph.to_undirected()) if self.graph.nodes() else 0
+        
         # Count node types
         for node in self.nodes.values():
             if node.node_type not in stats['node_types']:
@@ -297,7 +451,7 @@ class ArgumentGraph:
         
         return stats
     
-    def get_subgraph(self, node_ids: List[str]) -> 'ArgumentGraph':
+    def get_subgraph(self, node_ids: List[int]) -> 'ArgumentGraph':
         """
         Get a subgraph containing only specified nodes.
         
@@ -309,18 +463,17 @@ class ArgumentGraph:
         """
         subgraph = ArgumentGraph()
         
-        # Add nodes
-        for node_id in node_ids:
-            if node_id in self.nodes:
-                node = self.nodes[node_id]
-                subgraph.nodes[node_id] = node
-                subgraph.graph.add_node(node_id, **node.__dict__)
+        # Unknown IDs are dropped; order follows node_ids
+        subgraph.nodes = {node_id: self.nodes[node_id] for node_id in node_ids if node_id in self.nodes}
+        id_set = subgraph.nodes.keys()
         
-        # Add edges
-        for edge in self.edges:
-            if edge.from_node_id in node_ids and edge.to_node_id in node_ids:
-                subgraph.edges.append(edge)
-                subgraph.graph.add_edge(edge.from_node_id, edge.to_node_id, **edge.__dict__)
+        # networkx copies the induced structure, 'ref' attributes included
+        subgraph.graph = self.graph.subgraph(id_set).copy()
+        subgraph.edges = [edge for edge in self.edges
+                          if edge.from_node_id in id_set and edge.to_node_id in id_set]
+        subgraph._edge_keys = {(edge.from_node_id, edge.to_node_id, edge.relation) for edge in subgraph.edges}
+        # Nodes added to the subgraph later must not reuse an ID from this graph
+        subgraph.node_counter = self.node_counter
         
         return subgraph
     
@@ -332,22 +485,65 @@ class ArgumentGraph:
             Dictionary representation of the graph
         """
         return {
-            'nodes': {node_id: {
+            'nodes': {self._node_label(node_id): {
                 'node_type': node.node_type,
                 'confidence': node.confidence,
                 'content': str(node.content)
             } for node_id, node in self.nodes.items()},
             'edges': [{
-                'from_node': edge.from_node_id,
-                'to_node': edge.to_node_id,
+                'from_node': self._node_label(edge.from_node_id),
+                'to_node': self._node_label(edge.to_node_id),
                 'relation': edge.relation,
                 'confidence': edge.confidence,
                 'evidence': edge.evidence
             } for edge in self.edges],
-            'statistics': self.get_graph_statistics()
+            'statistics': self.get_graph_statistics(include_topology=False)
         }
     
-    def get_central_nodes(self, top_k: int = 5) -> List[str]:
+    def export_to_file(self, path: str) -> None:
+        """
+        Write the ``export_to_dict`` representation to a JSON file.
+        
+        Nodes and edges are serialized and written one at a time, so the
+        full dictionary and JSON string are never held in memory together.
+        
+        Args:
+            path: Output file path
+        """
+        with open(path, 'wb') as f:
+            f.write(b'{"nodes":{')
+            for i, (node_id, node) in enumerate(self.nodes.items()):
+                if i:
+                    f.write(b',')
+                f.write(_json_dumps(self._node_label(node_id)))
+                f.write(b':')
+                f.write(_json_dumps({
+                    'node_type': node.node_type,
+                    'confidence': node.confidence,
+                    'content': str(node.content)
+                }))
+            
+            f.write(b'},"edges":[')
+            for i, edge in enumerate(self.edges):
+                if i:
+                    f.write(b',')
+                f.write(_json_dumps({
+                    'from_node': self._node_label(edge.from_node_id),
+                    'to_node': self._node_label(edge.to_node_id),
+                    'relation': edge.relation,
+                    'confidence': edge.confidence,
+                    'evidence': edge.evidence
+                }))
+            
+            f.write(b'],"statistics":')
+            f.write(_json_dumps(self.get_graph_statistics(include_topology=False)))
+            f.write(b'}')
+    
+    def _node_label(self, node_id: int) -> str:
+        """External form of a node ID, e.g. 'claim_3'."""
+        return f"{self.nodes[node_id].node_type}_{node_id}"
+    
+    def get_central_nodes(self, top_k: int = 5) -> List[int]:
         """
         Get the most central nodes in the graph.
         
@@ -355,18 +551,47 @@ class ArgumentGraph:
             top_k: Number of top nodes to return
             
         Returns:
-            List of node IDs ordered by centrality
+            List of integer node IDs ordered by centrality
         """
         if not self.graph.nodes():
             return []
         
         # Calculate betweenness centrality
-        centrality = nx.betweenness_centrality(self.graph)
+        centrality = self._betweenness_centrality()
         
         # Sort by centrality and return top k
         sorted_nodes = sorted(centrality.items(), key=lambda x: x[1], reverse=True)
         return [node_id for node_id, _ in sorted_nodes[:top_k]]
-
-
-
-
+    
+    def _to_rustworkx(self) -> Tuple[Any, List[int]]:
+        """
+        Copy the graph structure into a rustworkx digraph.
+        
+        Returns:
+            Tuple of (PyDiGraph, node IDs indexed by rustworkx node index)
+        """
+        node_ids = list(self.graph.nodes())
+        index = {node_id: i for i, node_id in enumerate(node_ids)}
+        
+        rx_graph = rx.PyDiGraph(check_cycle=False, multigraph=False)
+        rx_graph.add_nodes_from(node_ids)
+        rx_graph.add_edges_from_no_data([(index[u], index[v]) for u, v in self.graph.edges()])
+        
+        return rx_graph, node_ids
+    
+    def _betweenness_centrality(self) -> Dict[int, float]:
+        """Betweenness centrality per node, computed in Rust when rustworkx is installed."""
+        if rx is None:
+            return nx.betweenness_centrality(self.graph)
+        
+        rx_graph, node_ids = self._to_rustworkx()
+        centrality = rx.digraph_betweenness_centrality(rx_graph, normalized=True, parallel_threshold=50)
+        return {node_id: centrality[i] for i, node_id in enumerate(node_ids)}
+    
+    def _count_strongly_connected_components(self) -> int:
+        """Number of strongly connected components, computed in Rust when rustworkx is installed."""
+        if rx is None:
+            return nx.number_strongly_connected_components(self.graph)
+        
+        rx_graph, _ = self._to_rustworkx()
+        return rx.number_strongly_connected_components(rx_graph)
@@ -6,17 +6,104 @@ and official statements from various sources.
 """
 
 import json
+import functools
 import hashlib
-from typing import Dict, List, Any, Optional, Iterator
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Dict, List, Any, Optional, Iterator, Tuple
 from datetime import datetime
 from dataclasses import dataclass
 from pathlib import Path
+from ._util import DATACLASS_SLOTS, MP_CONTEXT
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
 logger = logging.getLogger(__name__)
 
+# Everything before the first colon, if the first line has one
+_SPEAKER_RE = re.compile(r'([^\n:]*):')
+
+# orjson parses bytes directly; stdlib json also accepts UTF-8 bytes
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# JSONL files at least this large are decoded in worker processes, in chunks of lines
+_PARALLEL_INGEST_BYTES = 10 * 1024 * 1024
+_INGEST_CHUNK_LINES = 10_000
+
+# Above this size blake3 hashes the content on several threads
+_PARALLEL_HASH_BYTES = 1 << 20
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO timestamp; sessions repeat across documents, so results are cached."""
+    return datetime.fromisoformat(value)
+
 
-@dataclass
+def _content_hash(content: bytes) -> str:
+    """
+    Hex digest of document content, prefixed with its algorithm.
+    
+    blake3 is used when installed and MD5 otherwise, so the prefix
+    ('blake3:' or 'md5:') keeps hashes from the two backends from being
+    compared as if they were the same kind of digest.
+    """
+    if blake3 is None:
+        return 'md5:' + hashlib.md5(content).hexdigest()
+    if len(content) >= _PARALLEL_HASH_BYTES:
+        return 'blake3:' + blake3.blake3(content, max_threads=blake3.blake3.AUTO).hexdigest()
+    return 'blake3:' + blake3.blake3(content).hexdigest()
+
+
+def _valid(data: Dict[str, Any]) -> bool:
+    """Same rule as ``PolicyIngestion.validate_document``, checked on the raw record."""
+    return bool(data.get('title') and data.get('content') and data.get('ext_id')
+                and data.get('source') and data.get('jurisdiction'))
+
+
+def _decode_lines(lines: List[bytes]) -> List[Tuple[Any, Optional[str]]]:
+    """
+    Decode a chunk of JSONL lines in a worker process.
+    
+    Args:
+        lines: Raw lines from the file
+        
+    Returns:
+        One ``(data, error)`` pair per line; ``error`` is the decode error
+        message, or None if the line parsed
+    """
+    decoded = []
+    for line in lines:
+        try:
+            decoded.append((_json_loads(line), None))
+        except ValueError as e:
+            # JSONDecodeError, orjson's error and UnicodeDecodeError on invalid UTF-8
+            decoded.append((None, str(e)))
+    return decoded
+
+
+def _read_line_chunks(file_path: str) -> Iterator[List[bytes]]:
+    """Yield the lines of a file in chunks of ``_INGEST_CHUNK_LINES``."""
+    with open(file_path, 'rb') as f:
+        while True:
+            chunk = list(islice(f, _INGEST_CHUNK_LINES))
+            if not chunk:
+                return
+            yield chunk
+
+
+@dataclass(**DATACLASS_SLOTS)
 class DebateDocument:
     """Represents a debate document with metadata."""
     ext_id: str
@@ -31,7 +118,7 @@ class DebateDocument:
     created_at: datetime
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DebateSegment:
     """Represents a segment within a debate document."""
     speaker: str
@@ -72,39 +159,94 @@ class PolicyIngestion:
         parser = self.supported_sources[source_type]
         return parser(file_path)
     
-    def ingest_from_jsonl(self, file_path: str) -> List[DebateDocument]:
+    def ingest_from_jsonl(self, file_path: str, n_jobs: Optional[int] = 1,
+                          skip_invalid: bool = False) -> List[DebateDocument]:
         """
         Ingest documents from a JSONL file.
         
+        With ``n_jobs`` other than 1, files of 10 MB or more are decoded in
+        worker processes, 10k lines at a time; documents are still built in
+        this process, in file order.
+        
         Args:
             file_path: Path to JSONL file
-            
+            n_jobs: Number of worker processes for large files; 1 (the
+                default) decodes serially, None or -1 uses every core
+            skip_invalid: Drop records that would fail ``validate_document``
+                before a document is built for them
+                
         Returns:
             List of debate documents
         """
+        if n_jobs == 1 or os.path.getsize(file_path) < _PARALLEL_INGEST_BYTES:
+            return list(self.iter_jsonl(file_path, skip_invalid))
+        
+        now = datetime.now()
         documents = []
         
-        with open(file_path, 'r', encoding='utf-8') as f:
+        max_workers = None if n_jobs is None or n_jobs < 0 else n_jobs
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=MP_CONTEXT) as executor:
+            decoded_chunks = executor.map(_decode_lines, _read_line_chunks(file_path))
+            line_num = 0
+            for decoded in decoded_chunks:
+                for data, error in decoded:
+                    line_num += 1
+                    if error is not None:
+                        logger.warning(f"Invalid JSON on line {line_num}: {error}")
+                        continue
+                    try:
+                        if skip_invalid and not _valid(data):
+                            continue
+                        documents.append(self._create_document_from_dict(data, now))
+                    except Exception as e:
+                        logger.error(f"Error processing line {line_num}: {e}")
+        
+        return documents
+    
+    def iter_jsonl(self, file_path: str, skip_invalid: bool = False) -> Iterator[DebateDocument]:
+        """
+        Stream documents from a JSONL file one line at a time.
+        
+        Invalid lines are logged and skipped, as in ``ingest_from_jsonl``.
+        
+        Args:
+            file_path: Path to JSONL file
+            skip_invalid: Drop records that would fail ``validate_document``
+                before a document is built for them
+            
+        Yields:
+            Debate documents in file order
+        """
+        # One timestamp for the whole batch
+        now = datetime.now()
+        
+        # Read bytes so lines are not decoded twice; the parser handles UTF-8
+        with open(file_path, 'rb') as f:
             for line_num, line in enumerate(f, 1):
                 try:
-                    data = json.loads(line.strip())
-                    doc = self._create_document_from_dict(data)
-                    documents.append(doc)
+                    data = _json_loads(line)
+                    if skip_invalid and not _valid(data):
+                        continue
+                    doc = self._create_document_from_dict(data, now)
                 except json.JSONDecodeError as e:
                     logger.warning(f"Invalid JSON on line {line_num}: {e}")
+                    continue
                 except Exception as e:
                     logger.error(f"Error processing line {line_num}: {e}")
-        
-        return documents
+                    continue
+                yield doc
     
-    def _create_document_from_dict(self, data: Dict[str, Any]) -> DebateDocument:
-        """Create a DebateDocument from a dictionary."""
+    def _create_document_from_dict(self, data: Dict[str, Any], now: Optional[datetime] = None) -> DebateDocument:
+        """Create a DebateDocument from a dictionary, stamped with ``now`` (default: current time)."""
+        if now is None:
+            now = datetime.now()
+        
         # Generate hash from content
         content = data.get('content', '')
-        content_hash = hashlib.md5(content.encode()).hexdigest()
+        content_hash = _content_hash(content.encode('utf-8'))
         
         # Parse date
-        session_date = datetime.fromisoformat(data.get('session_date', datetime.now().isoformat()))
+        session_date = _parse_iso(data['session_date']) if 'session_date' in data else now
         
         return DebateDocument(
             ext_id=data.get('ext_id', ''),
@@ -116,7 +258,7 @@ class PolicyIngestion:
             media_type=data.get('media_type', 'text'),
             content=content,
             hash=content_hash,
-            created_at=datetime.now()
+            created_at=now
         )
     
     def _parse_jsonl_file(self, file_path: str) -> List[DebateDocument]:
@@ -163,7 +305,8 @@ class PolicyIngestion:
         paragraphs = document.content.split('\n\n')
         
         for i, paragraph in enumerate(paragraphs):
-            if paragraph.strip():
+            text = paragraph.strip()
+            if text:
                 # Extract speaker information (simple heuristic)
                 speaker = self._extract_speaker(paragraph)
                 
@@ -172,7 +315,7 @@ class PolicyIngestion:
                     party=None,  # Would be extracted in full implementation
                     start_ts=None,
                     end_ts=None,
-                    text=paragraph.strip(),
+                    text=text,
                     asr_confidence=None,
                     turn_index=i
                 )
@@ -183,11 +326,10 @@ class PolicyIngestion:
     def _extract_speaker(self, text: str) -> str:
         """Extract speaker name from text (stub implementation)."""
         # Simple heuristic: look for patterns like "Speaker: " or "Mr. Smith: "
-        lines = text.split('\n')
-        if lines:
-            first_line = lines[0]
-            if ':' in first_line:
-                return first_line.split(':')[0].strip()
+        # on the first line, without splitting the rest of the paragraph
+        match = _SPEAKER_RE.match(text)
+        if match:
+            return match.group(1).strip()
         return "Unknown Speaker"
     
     def validate_document(self, document: DebateDocument) -> bool:
@@ -5,7 +5,8 @@ This module bridges the policy argument mining layer to the event detection
 and financial impact analysis layers.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+from collections import Counter
 from dataclasses import dataclass
 from .ingestion import DebateSegment
 from .claim_detection import Claim
@@ -14,24 +15,60 @@ from .argument_role_labeling import ArgumentRole
 from .frame_mining import Frame
 from .entity_linking import Entity
 from .graph import ArgumentGraph
+from ._util import DATACLASS_SLOTS
 from .scoring import ArgumentScorer, ArgumentScores
 from domains.base import Event, Shock
+import numpy as np
 import logging
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
+_URGENCY_INDICATORS = (
+    'urgent', 'immediate', 'crisis', 'emergency', 'critical',
+    'now', 'asap', 'deadline', 'time-sensitive', 'pressing'
+)
+
+# Claims/stances scored between early-exit checks in _analyze_uncertainty
+_UNCERTAINTY_CHUNK = 256
+
+_URGENT_FRAMES = frozenset(['public_safety', 'national_security', 'climate_risk'])
+
+
+def _build_urgency_automaton():
+    """Compile the urgency indicators into one Aho-Corasick automaton."""
+    automaton = ahocorasick.Automaton()
+    for indicator in _URGENCY_INDICATORS:
+        automaton.add_word(indicator, indicator)
+    automaton.make_automaton()
+    return automaton
+
+
+# Optional backend: count every indicator in a single pass over the text.
+# No indicator overlaps itself, so this matches summing str.count per indicator.
+_URGENCY_AUTOMATON = _build_urgency_automaton() if ahocorasick is not None else None
+
 
-@dataclass
+def _argument_ids(*groups: Tuple[str, int]) -> Tuple[str, ...]:
+    """IDs like 'claim_0', 'claim_1', 'stance_0' for (prefix, count) groups, in order."""
+    return tuple(f"{prefix}_{i}" for prefix, count in groups for i in range(count))
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class PolicySignal:
-    """Represents a policy signal derived from argument analysis."""
+    """Represents a policy signal derived from argument analysis; immutable and hashable."""
     signal_type: str  # uncertainty, consensus, polarization, urgency
     intensity: float  # 0.0 to 1.0
     confidence: float  # 0.0 to 1.0
     evidence: str
-    source_arguments: List[str]  # IDs of source arguments
+    source_arguments: Tuple[str, ...]  # IDs of source arguments
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class PolicyImpact:
     """Represents the impact of policy arguments on financial predictions."""
     impact_direction: str  # positive, negative, neutral
@@ -44,6 +81,15 @@ class PolicyImpact:
 class PolicyArgumentIntegrator:
     """Integrates policy argument analysis with event detection and financial impact."""
     
+    # Impact adjustments per signal type: magnitude gained and confidence lost
+    # per unit of signal intensity, and the timeframe the signal forces (if any)
+    impact_adjustments = {
+        'uncertainty': {'magnitude': 0.0, 'confidence': 0.3, 'timeframe': 'short_term'},
+        'consensus': {'magnitude': 0.0, 'confidence': 0.0, 'timeframe': None},
+        'polarization': {'magnitude': 0.4, 'confidence': 0.0, 'timeframe': None},
+        'urgency': {'magnitude': 0.7, 'confidence': 0.0, 'timeframe': 'short_term'}
+    }
+    
     def __init__(self):
         self.scorer = ArgumentScorer()
         
@@ -52,14 +98,6 @@ class PolicyArgumentIntegrator:
         self.consensus_threshold = 0.7
         self.polarization_threshold = 0.5
         self.urgency_threshold = 0.8
-        
-        # Impact mapping weights
-        self.impact_weights = {
-            'uncertainty': {'magnitude': 0.3, 'timeframe': 'short_term'},
-            'consensus': {'magnitude': 0.5, 'timeframe': 'medium_term'},
-            'polarization': {'magnitude': 0.4, 'timeframe': 'medium_term'},
-            'urgency': {'magnitude': 0.7, 'timeframe': 'short_term'}
-        }
     
     def analyze_policy_arguments(self, claims: List[Claim], stances: List[Stance], 
                                entities: List[Entity], frames: List[Frame], 
@@ -79,18 +117,21 @@ class PolicyArgumentIntegrator:
         """
         signals = []
         
+        # Consensus and polarization share one pass over the stance labels
+        stance_counts = self._tally_stances(stances)
+        
         # Analyze uncertainty
         uncertainty_signal = self._analyze_uncertainty(claims, stances, graph)
         if uncertainty_signal:
             signals.append(uncertainty_signal)
         
         # Analyze consensus
-        consensus_signal = self._analyze_consensus(stances, graph)
+        consensus_signal = self._analyze_consensus(stances, graph, stance_counts)
         if consensus_signal:
             signals.append(consensus_signal)
         
         # Analyze polarization
-        polarization_signal = self._analyze_polarization(stances, graph)
+        polarization_signal = self._analyze_polarization(stances, graph, stance_counts)
         if polarization_signal:
             signals.append(polarization_signal)
         
@@ -142,19 +183,16 @@ class PolicyArgumentIntegrator:
         
         # Adjust based on policy signals
         for signal in policy_signals:
-            adjustment = self._calculate_signal_adjustment(signal)
+            adjustment = self.impact_adjustments.get(signal.signal_type)
+            if adjustment is None:
+                continue
             
-            # Adjust magnitude
-            if signal.signal_type == 'urgency':
-                impact_magnitude = min(1.0, impact_magnitude + adjustment['magnitude'])
-            elif signal.signal_type == 'uncertainty':
-                confidence = max(0.1, confidence - adjustment['confidence'])
-            elif signal.signal_type == 'polarization':
-                impact_magnitude = min(1.0, impact_magnitude + adjustment['magnitude'])
-            
-            # Adjust timeframe
-            if signal.signal_type in ['urgency', 'uncertainty']:
-                impact_timeframe = 'short_term'
+            if adjustment['magnitude']:
+                impact_magnitude = min(1.0, impact_magnitude + signal.intensity * adjustment['magnitude'])
+            if adjustment['confidence']:
+                confidence = max(0.1, confidence - signal.intensity * adjustment['confidence'])
+            if adjustment['timeframe'] is not None:
+                impact_timeframe = adjustment['timeframe']
         
         return PolicyImpact(
             impact_direction=impact_direction,
@@ -170,15 +208,21 @@ class PolicyArgumentIntegrator:
         if not claims and not stances:
             return None
         
-        # Calculate average uncertainty
-        claim_scores = [self.scorer.score_claim(claim, graph) for claim in claims]
-        stance_scores = [self.scorer.score_stance(stance, graph) for stance in stances]
+        # Calculate average uncertainty; only the uncertainty component is needed.
+        # Scores are at most 1.0, so stop once the unscored remainder could no
+        # longer lift the average over the threshold.
+        total = len(claims) + len(stances)
+        needed = self.uncertainty_threshold * total
+        running_sum = 0.0
+        remaining = total
         
-        all_scores = claim_scores + stance_scores
-        if not all_scores:
-            return None
+        for uncertainties in self._uncertainty_chunks(claims, stances):
+            running_sum += float(uncertainties.sum())
+            remaining -= len(uncertainties)
+            if running_sum + remaining < needed:
+                return None
         
-        avg_uncertainty = sum(score.uncertainty for score in all_scores) / len(all_scores)
+        avg_uncertainty = running_sum / total
         
         if avg_uncertainty > self.uncertainty_threshold:
             return PolicySignal(
@@ -186,51 +230,62 @@ class PolicyArgumentIntegrator:
                 intensity=avg_uncertainty,
                 confidence=0.7,
                 evidence=f"Average uncertainty score: {avg_uncertainty:.2f}",
-                source_arguments=[f"claim_{i}" for i in range(len(claims))] + [f"stance_{i}" for i in range(len(stances))]
+                source_arguments=_argument_ids(('claim', len(claims)), ('stance', len(stances)))
             )
         
         return None
     
+    def _uncertainty_chunks(self, claims: List[Claim], stances: List[Stance]) -> Iterator[np.ndarray]:
+        """Yield uncertainty scores for claims, then stances, ``_UNCERTAINTY_CHUNK`` at a time."""
+        for start in range(0, len(claims), _UNCERTAINTY_CHUNK):
+            yield self.scorer.claim_uncertainties(claims[start:start + _UNCERTAINTY_CHUNK])
+        for start in range(0, len(stances), _UNCERTAINTY_CHUNK):
+            yield self.scorer.stance_uncertainties(stances[start:start + _UNCERTAINTY_CHUNK])
+    
+    def _tally_stances(self, stances: List[Stance]) -> Counter:
+        """Count stances per label in a single pass; missing labels count as 0."""
+        return Counter(stance.stance_label for stance in stances)
+    
     def _analyze_consensus(self, stances: List[Stance], 
-                          graph: Optional[ArgumentGraph] = None) -> Optional[PolicySignal]:
-        """Analyze consensus in policy stances."""
+                          graph: Optional[ArgumentGraph] = None,
+                          stance_counts: Optional[Counter] = None) -> Optional[PolicySignal]:
+        """Analyze consensus in policy stances, reusing ``stance_counts`` from ``_tally_stances`` if given."""
         if not stances:
             return None
         
         # Count stance types
-        stance_counts = {'support': 0, 'oppose': 0, 'neutral': 0}
-        for stance in stances:
-            stance_counts[stance.stance_label] += 1
+        if stance_counts is None:
+            stance_counts = self._tally_stances(stances)
         
         total_stances = len(stances)
-        if total_stances == 0:
-            return None
         
         # Calculate consensus (dominance of one stance)
-        max_count = max(stance_counts.values())
+        dominant_stance, max_count = stance_counts.most_common(1)[0]
         consensus_ratio = max_count / total_stances
         
         if consensus_ratio > self.consensus_threshold:
-            dominant_stance = max(stance_counts, key=stance_counts.get)
             return PolicySignal(
                 signal_type='consensus',
                 intensity=consensus_ratio,
                 confidence=0.8,
                 evidence=f"Consensus on {dominant_stance}: {consensus_ratio:.2f}",
-                source_arguments=[f"stance_{i}" for i in range(len(stances))]
+                source_arguments=_argument_ids(('stance', len(stances)))
             )
         
         return None
     
     def _analyze_polarization(self, stances: List[Stance], 
-                             graph: Optional[ArgumentGraph] = None) -> Optional[PolicySignal]:
-        """Analyze polarization in policy stances."""
+                             graph: Optional[ArgumentGraph] = None,
+                             stance_counts: Optional[Counter] = None) -> Optional[PolicySignal]:
+        """Analyze polarization in policy stances, reusing ``stance_counts`` from ``_tally_stances`` if given."""
         if not stances:
             return None
         
         # Count support vs oppose
-        support_count = sum(1 for stance in stances if stance.stance_label == 'support')
-        oppose_count = sum(1 for stance in stances if stance.stance_label == 'oppose')
+        if stance_counts is None:
+            stance_counts = self._tally_stances(stances)
+        support_count = stance_counts['support']
+        oppose_count = stance_counts['oppose']
         
         total_controversial = support_count + oppose_count
         if total_controversial == 0:
@@ -245,7 +300,7 @@ class PolicyArgumentIntegrator:
                 intensity=polarization,
                 confidence=0.7,
                 evidence=f"Polarization: {support_count} support vs {oppose_count} oppose",
-                source_arguments=[f"stance_{i}" for i in range(len(stances))]
+                source_arguments=_argument_ids(('stance', len(stances)))
             )
         
         return None
@@ -253,26 +308,17 @@ class PolicyArgumentIntegrator:
     def _analyze_urgency(self, claims: List[Claim], frames: List[Frame], 
                         graph: Optional[ArgumentGraph] = None) -> Optional[PolicySignal]:
         """Analyze urgency in policy arguments."""
-        urgency_indicators = [
-            'urgent', 'immediate', 'crisis', 'emergency', 'critical',
-            'now', 'asap', 'deadline', 'time-sensitive', 'pressing'
-        ]
-        
-        urgency_count = 0
-        total_text = ""
-        
-        # Check claims for urgency indicators
-        for claim in claims:
-            total_text += claim.text.lower() + " "
-        
         # Check frames for urgency indicators
-        for frame in frames:
-            if frame.frame_label in ['public_safety', 'national_security', 'climate_risk']:
-                urgency_count += 1
+        urgency_count = sum(1 for frame in frames if frame.frame_label in _URGENT_FRAMES)
+        
+        # Count urgency words; the separator keeps matches from spanning two claims
+        total_text = " ".join(claim.text for claim in claims).lower()
         
-        # Count urgency words
-        for indicator in urgency_indicators:
-            urgency_count += total_text.count(indicator)
+        if _URGENCY_AUTOMATON is not None:
+            urgency_count += sum(1 for _ in _URGENCY_AUTOMATON.iter(total_text))
+        else:
+            for indicator in _URGENCY_INDICATORS:
+                urgency_count += total_text.count(indicator)
         
         urgency_intensity = min(1.0, urgency_count / max(1, len(claims)))
         
@@ -282,7 +328,7 @@ class PolicyArgumentIntegrator:
                 intensity=urgency_intensity,
                 confidence=0.6,
                 evidence=f"Urgency indicators found: {urgency_count}",
-                source_arguments=[f"claim_{i}" for i in range(len(claims))] + [f"frame_{i}" for i in range(len(frames))]
+                source_arguments=_argument_ids(('claim', len(claims)), ('frame', len(frames)))
             )
         
         return None
@@ -321,16 +367,6 @@ class PolicyArgumentIntegrator:
             confidence=signal.confidence
         )
     
-    def _calculate_signal_adjustment(self, signal: PolicySignal) -> Dict[str, float]:
-        """Calculate adjustment factors for a policy signal."""
-        weights = self.impact_weights.get(signal.signal_type, {'magnitude': 0.2, 'timeframe': 'medium_term'})
-        
-        return {
-            'magnitude': signal.intensity * weights['magnitude'],
-            'confidence': signal.intensity * 0.3,
-            'timeframe': weights['timeframe']
-        }
-    
     def get_policy_summary(self, policy_signals: List[PolicySignal]) -> Dict[str, Any]:
         """
         Get a summary of policy signals.
@@ -350,20 +386,18 @@ class PolicyArgumentIntegrator:
             }
         
         # Count signal types
-        signal_types = {}
-        for signal in policy_signals:
-            if signal.signal_type not in signal_types:
-                signal_types[signal.signal_type] = 0
-            signal_types[signal.signal_type] += 1
+        signal_types = dict(Counter(signal.signal_type for signal in policy_signals))
         
         # Calculate overall intensity
-        overall_intensity = sum(signal.intensity for signal in policy_signals) / len(policy_signals)
+        intensities = np.fromiter((signal.intensity for signal in policy_signals),
+                                  dtype=np.float64, count=len(policy_signals))
+        overall_intensity = float(intensities.mean())
         
         # Generate key insights
-        key_insights = []
-        for signal in policy_signals:
-            if signal.intensity > 0.7:
-                key_insights.append(f"High {signal.signal_type}: {signal.evidence}")
+        key_insights = [
+            f"High {policy_signals[i].signal_type}: {policy_signals[i].evidence}"
+            for i in np.flatnonzero(intensities > 0.7)
+        ]
         
         return {
             'total_signals': len(policy_signals),
@@ -5,13 +5,23 @@ This module handles cleaning, normalization, and preprocessing of policy documen
 and debate transcripts.
 """
 
+import functools
 import re
-from typing import List, Dict, Any, Union
+from typing import List, Dict, Any, Match, Union
 from .ingestion import DebateSegment
+from ._util import map_in_processes, split_sentences
 import logging
 
 logger = logging.getLogger(__name__)
 
+_DOUBLE_QUOTE_RE = re.compile(r'"([^"]*)"')
+_SINGLE_QUOTE_RE = re.compile(r"'([^']*)'")
+
+
+def _first_char(match: Match[str]) -> str:
+    """Collapse a matched run of one character to a single character."""
+    return match.group()[0]
+
 
 class PolicyPreprocessor:
     """Handles preprocessing of policy documents and debate segments."""
@@ -29,10 +39,41 @@ class PolicyPreprocessor:
             r'\!{2,}': '!',  # Multiple exclamation marks to single
             r'\?{2,}': '?',  # Multiple question marks to single
         }
+        
+        # Compiled once. Bracketed and parenthetical text go in one alternation pass;
+        # the character filter (last pattern) runs afterwards, via str.translate on
+        # ASCII text. Scanning for the enclosed spans never depends on the filter,
+        # so this matches removing all three patterns in one alternation.
+        self._enclosed_re = re.compile('|'.join(self.noise_patterns[:-1]))
+        self._noise_char_re = re.compile(self.noise_patterns[-1])
+        self._ascii_noise_table = {i: None for i in range(128) if self._noise_char_re.match(chr(i))}
+        self._ws_re = re.compile(r'\s+')
+        self._norm_rules = [(re.compile(pattern), replacement)
+                            for pattern, replacement in self.normalization_rules.items()]
+        # The three punctuation rules above as one pass
+        self._punct_run_re = re.compile(r'\.{2,}|!{2,}|\?{2,}')
+        # Transcripts repeat short turns ("Order, order.", "Hear, hear!"); clean each text once
+        self._preprocessed_text = functools.lru_cache(maxsize=4096)(self.preprocess_text)
     
     def preprocess_text(self, text: str) -> str:
-        """Preprocess raw text (clean + normalize)."""
-        return self._normalize_text(self._clean_text(text or "")).strip()
+        """
+        Preprocess raw text (clean + normalize).
+        
+        Same result as ``_normalize_text(_clean_text(text))`` in three passes
+        instead of eight: whitespace is collapsed once rather than by both
+        steps, and the punctuation runs are collapsed together. Noise removal
+        has to finish first, since removing it can leave whitespace or
+        punctuation runs behind.
+        
+        Args:
+            text: Raw text
+            
+        Returns:
+            Preprocessed text
+        """
+        cleaned = self._remove_noise(text or "")
+        cleaned = self._ws_re.sub(' ', cleaned).strip()
+        return self._punct_run_re.sub(_first_char, cleaned)
     
     def preprocess_segment(self, segment: Union[DebateSegment, str]) -> DebateSegment:
         """
@@ -42,50 +83,69 @@ class PolicyPreprocessor:
             segment: Debate segment OR raw text string
             
         Returns:
-            Preprocessed DebateSegment
+            Preprocessed DebateSegment; the input segment itself when its
+            text is already clean
         """
-        if isinstance(segment, str):
-            raw_text = segment
-            segment_obj = DebateSegment(
-                speaker="",
-                party="",
-                start_ts=0.0,
-                end_ts=0.0,
-                text=raw_text,
-                asr_confidence=1.0,
-                turn_index=0
-            )
-        else:
-            segment_obj = segment
+        segment_obj = self._as_segment(segment)
         
-        # Clean text
-        cleaned_text = self._clean_text(segment_obj.text)
-        
-        # Normalize text
-        normalized_text = self._normalize_text(cleaned_text)
+        # Clean and normalize text
+        normalized_text = self._preprocessed_text(segment_obj.text)
         
         # Create new segment with cleaned text
-        return DebateSegment(
-            speaker=segment_obj.speaker,
-            party=segment_obj.party,
-            start_ts=segment_obj.start_ts,
-            end_ts=segment_obj.end_ts,
-            text=normalized_text,
-            asr_confidence=segment_obj.asr_confidence,
-            turn_index=segment_obj.turn_index
-        )
-
-    def preprocess_segments(self, segments: List[DebateSegment]) -> List[DebateSegment]:
+        return self._with_text(segment_obj, normalized_text)
+    
+    def preprocess_segments(self, segments: List[DebateSegment], n_jobs: int = 1) -> List[DebateSegment]:
         """
         Preprocess multiple debate segments.
         
         Args:
             segments: List of debate segments
+            n_jobs: Worker processes for cleaning; 1 runs in-process, -1 uses
+                every core
             
         Returns:
-            List of preprocessed segments
+            List of preprocessed segments; already-clean segments are
+            returned as is
         """
-        return [self.preprocess_segment(segment) for segment in segments]
+        if n_jobs == 1 or len(segments) < 2:
+            return [self.preprocess_segment(segment) for segment in segments]
+        
+        # re holds the GIL while matching, so threads would not help; only the texts
+        # cross the process boundary
+        segment_objs = [self._as_segment(segment) for segment in segments]
+        texts = map_in_processes(type(self), 'preprocess_text',
+                                 [(segment_obj.text,) for segment_obj in segment_objs], n_jobs)
+        
+        return [self._with_text(segment_obj, text) for segment_obj, text in zip(segment_objs, texts)]
+    
+    def _as_segment(self, segment: Union[DebateSegment, str]) -> DebateSegment:
+        """Wrap raw text in a default DebateSegment; segments are returned as is."""
+        if isinstance(segment, str):
+            return DebateSegment(
+                speaker="",
+                party="",
+                start_ts=0.0,
+                end_ts=0.0,
+                text=segment,
+                asr_confidence=1.0,
+                turn_index=0
+            )
+        return segment
+    
+    def _with_text(self, segment: DebateSegment, text: str) -> DebateSegment:
+        """Copy of a segment with its text replaced, or the segment itself if the text is unchanged."""
+        if text == segment.text:
+            return segment
+        
+        return DebateSegment(
+            speaker=segment.speaker,
+            party=segment.party,
+            start_ts=segment.start_ts,
+            end_ts=segment.end_ts,
+            text=text,
+            asr_confidence=segment.asr_confidence,
+            turn_index=segment.turn_index
+        )
     
     def _clean_text(self, text: str) -> str:
         """
@@ -97,17 +157,21 @@ class PolicyPreprocessor:
         Returns:
             Cleaned text
         """
-        cleaned = text or ""
-        
         # Remove noise patterns
-        for pattern in self.noise_patterns:
-            cleaned = re.sub(pattern, '', cleaned)
+        cleaned = self._remove_noise(text or "")
         
         # Remove extra whitespace
-        cleaned = re.sub(r'\s+', ' ', cleaned)
+        cleaned = self._ws_re.sub(' ', cleaned)
         
         return cleaned.strip()
     
+    def _remove_noise(self, text: str) -> str:
+        """Remove bracketed text, parenthetical text and special characters."""
+        text = self._enclosed_re.sub('', text)
+        if text.isascii():
+            return text.translate(self._ascii_noise_table)
+        return self._noise_char_re.sub('', text)
+    
     def _normalize_text(self, text: str) -> str:
         """
         Normalize text according to rules.
@@ -121,8 +185,8 @@ class PolicyPreprocessor:
         normalized = text or ""
         
         # Apply normalization rules
-        for pattern, replacement in self.normalization_rules.items():
-            normalized = re.sub(pattern, replacement, normalized)
+        for pattern, replacement in self._norm_rules:
+            normalized = pattern.sub(replacement, normalized)
         
         return normalized.strip()
     
@@ -136,9 +200,11 @@ class PolicyPreprocessor:
         Returns:
             List of quoted strings
         """
-        # Simple quote extraction (stub implementation)
-        quotes = re.findall(r'"([^"]*)"', text or "")
-        quotes.extend(re.findall(r"'([^']*)'", text or ""))
+        # Simple quote extraction (stub implementation); double quotes first,
+        # then single quotes, each scanned over the whole text
+        text = text or ""
+        quotes = _DOUBLE_QUOTE_RE.findall(text)
+        quotes.extend(_SINGLE_QUOTE_RE.findall(text))
         return quotes
     
     def extract_speaker_tags(self, text: str) -> Dict[str, str]:
@@ -177,9 +243,8 @@ class PolicyPreprocessor:
         Returns:
             List of sentences
         """
-        # Simple sentence splitting (stub implementation)
-        sentences = re.split(r'[.!?]+', text or "")
-        return [s.strip() for s in sentences if s.strip()]
+        # Simple sentence splitting (stub implementation), shared with the other stages
+        return list(split_sentences(text or ""))
     
     def remove_noise(self, text: str) -> str:
         """
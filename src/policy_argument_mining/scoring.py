@@ -5,8 +5,9 @@ This module computes salience, credibility, and uncertainty scores
 for arguments in policy debates.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from dataclasses import dataclass
+from operator import attrgetter
 from .ingestion import DebateSegment
 from .claim_detection import Claim
 from .stance_detection import Stance
@@ -14,12 +15,141 @@ from .argument_role_labeling import ArgumentRole
 from .frame_mining import Frame
 from .entity_linking import Entity
 from .graph import ArgumentGraph
+from ._util import DATACLASS_SLOTS
+import numpy as np
+import functools
+import heapq
+import re
 import logging
 
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
 logger = logging.getLogger(__name__)
 
+# Overall score weights of salience, credibility and certainty (1 - uncertainty)
+# for claims and stances, shared by the scalar, NumPy and compiled scorers
+_SALIENCE_WEIGHT = 0.4
+_CREDIBILITY_WEIGHT = 0.4
+_CERTAINTY_WEIGHT = 0.2
+
+# The same weights for entities, which lean on credibility (entity linking)
+_ENTITY_SALIENCE_WEIGHT = 0.3
+_ENTITY_CREDIBILITY_WEIGHT = 0.5
+_ENTITY_CERTAINTY_WEIGHT = 0.2
+
+# Smallest claim batch worth handing to the compiled scoring kernel; below
+# this the NumPy path is already fast and thread start-up dominates
+_NUMBA_MIN_BATCH = 10_000
+
+# Source categories in priority order, one alternation of source keywords
+# each. A source mentioning keywords of several categories gets the first,
+# so these are searched one category at a time rather than as one
+# alternation, whose leftmost match could come from a lower category.
+_SOURCE_TYPE_PATTERNS = (
+    ('official', re.compile(r'congress|senate|house|federal')),
+    ('academic', re.compile(r'university|college|research')),
+    ('media', re.compile(r'news|press|media')),
+)
+
+
+def _segment_source(segment: DebateSegment) -> str:
+    """Source name of a segment, or '' for segments without one, like DebateSegment."""
+    return getattr(segment, 'source', None) or ''
+
+
+@functools.lru_cache(maxsize=4096)
+def _count_indicators(text_lower: str, indicators: Tuple[str, ...]) -> int:
+    """
+    Count how many indicators occur in the lowercased text.
+    
+    Memoized, so rescoring the same claim skips the scan.
+    
+    Args:
+        text_lower: Lowercased text to search
+        indicators: Lowercase indicator substrings
+        
+    Returns:
+        Number of indicators found
+    """
+    return sum(1 for indicator in indicators if indicator in text_lower)
+
+
+def _claim_score_columns(confidence: np.ndarray, has_evidence: np.ndarray,
+                         centrality: np.ndarray, evidence_counts: np.ndarray,
+                         uncertainty_counts: np.ndarray, source_quality: np.ndarray) -> np.ndarray:
+    """
+    Compute claim scores for a whole batch with array arithmetic.
+    
+    Applies the same operations, in the same order, as ``score_claim``, so
+    each row equals the scalar result. Claims with no graph node have a
+    centrality of 0.
+    
+    Args:
+        confidence: Claim confidences
+        has_evidence: Whether each claim has evidence spans
+        centrality: Degree centrality of each claim's graph node
+        evidence_counts: Evidence indicators found in each claim
+        uncertainty_counts: Uncertainty indicators found in each claim
+        source_quality: Source quality of each claim's segment
+        
+    Returns:
+        Float array of shape (N, 4): salience, credibility, uncertainty
+        and overall score
+    """
+    salience = confidence + np.where(has_evidence, 0.2, 0.0)
+    salience += centrality * 0.3
+    np.minimum(salience, 1.0, out=salience)
+    
+    credibility = 0.5 + np.minimum(0.3, evidence_counts * 0.1)
+    credibility += source_quality * 0.2
+    np.minimum(credibility, 1.0, out=credibility)
+    
+    uncertainty = 0.3 + np.minimum(0.4, uncertainty_counts * 0.1)
+    uncertainty -= confidence * 0.2
+    np.clip(uncertainty, 0.0, 1.0, out=uncertainty)
+    
+    overall = (_SALIENCE_WEIGHT * salience + _CREDIBILITY_WEIGHT * credibility
+               + _CERTAINTY_WEIGHT * (1 - uncertainty))
+    
+    return np.column_stack((salience, credibility, uncertainty, overall))
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _claim_score_kernel(confidence, has_evidence, centrality, evidence_counts,
+                            uncertainty_counts, source_quality):
+        """Compiled, multi-threaded equivalent of ``_claim_score_columns``."""
+        n = confidence.size
+        scores = np.empty((n, 4))
+        
+        for i in prange(n):
+            salience = confidence[i] + (0.2 if has_evidence[i] else 0.0)
+            salience += centrality[i] * 0.3
+            salience = min(salience, 1.0)
+            
+            credibility = 0.5 + min(0.3, evidence_counts[i] * 0.1)
+            credibility += source_quality[i] * 0.2
+            credibility = min(credibility, 1.0)
+            
+            uncertainty = 0.3 + min(0.4, uncertainty_counts[i] * 0.1)
+            uncertainty -= confidence[i] * 0.2
+            uncertainty = min(max(uncertainty, 0.0), 1.0)
+            
+            scores[i, 0] = salience
+            scores[i, 1] = credibility
+            scores[i, 2] = uncertainty
+            scores[i, 3] = (_SALIENCE_WEIGHT * salience + _CREDIBILITY_WEIGHT * credibility
+                            + _CERTAINTY_WEIGHT * (1 - uncertainty))
+        
+        return scores
+else:
+    _claim_score_kernel = None
+
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ArgumentScores:
     """Represents scores for an argument."""
     salience: float  # Frequency and centrality
@@ -28,6 +158,24 @@ class ArgumentScores:
     overall_score: float  # Combined score
 
 
+@dataclass(**DATACLASS_SLOTS)
+class _ScoredArgument:
+    """Compact scored argument record used while ranking."""
+    type: str
+    content: str
+    scores: ArgumentScores
+    source: Any
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the dictionary form returned by get_top_scored_arguments."""
+        return {
+            'type': self.type,
+            'content': self.content,
+            'scores': self.scores,
+            'source': self.source
+        }
+
+
 class ArgumentScorer:
     """Computes various scores for arguments in policy debates."""
     
@@ -50,24 +198,37 @@ class ArgumentScorer:
             'maybe', 'perhaps', 'possibly', 'uncertain', 'unclear',
             'debate', 'controversy', 'dispute', 'disagreement', 'conflict'
         ]
+        
+        # Source string -> source_quality_weights key. A corpus has far fewer
+        # distinct sources than arguments, and caching the category rather
+        # than the weight keeps later weight changes effective.
+        self._source_type_cache: Dict[str, str] = {}
     
-    def score_claim(self, claim: Claim, graph: Optional[ArgumentGraph] = None) -> ArgumentScores:
+    def score_claim(self, claim: Claim, graph: Optional[ArgumentGraph] = None,
+                    centrality_index: Optional[Dict[str, float]] = None) -> ArgumentScores:
         """
         Score a claim.
         
         Args:
             claim: Claim to score
             graph: Optional argument graph for centrality calculation
+            centrality_index: Optional claim text to centrality index of
+                ``graph``, as built by ``build_centrality_index``; pass it when
+                scoring many claims against the same graph
             
         Returns:
             ArgumentScores for the claim
         """
-        salience = self._calculate_salience(claim, graph)
-        credibility = self._calculate_credibility(claim)
-        uncertainty = self._calculate_uncertainty(claim)
+        # Lowercased once for both indicator sets
+        text_lower = claim.text.lower()
+        
+        salience = self._calculate_salience(claim, graph, centrality_index)
+        credibility = self._calculate_credibility(claim, text_lower)
+        uncertainty = self._calculate_uncertainty(claim, text_lower)
         
         # Overall score is weighted combination
-        overall_score = (0.4 * salience + 0.4 * credibility + 0.2 * (1 - uncertainty))
+        overall_score = (_SALIENCE_WEIGHT * salience + _CREDIBILITY_WEIGHT * credibility
+                         + _CERTAINTY_WEIGHT * (1 - uncertainty))
         
         return ArgumentScores(
             salience=salience,
@@ -76,22 +237,26 @@ class ArgumentScorer:
             overall_score=overall_score
         )
     
-    def score_stance(self, stance: Stance, graph: Optional[ArgumentGraph] = None) -> ArgumentScores:
+    def score_stance(self, stance: Stance, graph: Optional[ArgumentGraph] = None,
+                     centrality_index: Optional[Dict[str, float]] = None) -> ArgumentScores:
         """
         Score a stance.
         
         Args:
             stance: Stance to score
             graph: Optional argument graph for centrality calculation
+            centrality_index: Optional stance target to centrality index of
+                ``graph``, as built by ``build_centrality_index``
             
         Returns:
             ArgumentScores for the stance
         """
-        salience = self._calculate_stance_salience(stance, graph)
+        salience = self._calculate_stance_salience(stance, graph, centrality_index)
         credibility = self._calculate_stance_credibility(stance)
         uncertainty = self._calculate_stance_uncertainty(stance)
         
-        overall_score = (0.4 * salience + 0.4 * credibility + 0.2 * (1 - uncertainty))
+        overall_score = (_SALIENCE_WEIGHT * salience + _CREDIBILITY_WEIGHT * credibility
+                         + _CERTAINTY_WEIGHT * (1 - uncertainty))
         
         return ArgumentScores(
             salience=salience,
@@ -100,6 +265,87 @@ class ArgumentScorer:
             overall_score=overall_score
         )
     
+    def score_claims_batch(self, claims: List[Claim], graph: Optional[ArgumentGraph] = None,
+                           centrality_index: Optional[Dict[str, float]] = None) -> np.ndarray:
+        """
+        Score many claims at once.
+        
+        Only the per-claim text and source lookups run in Python; the score
+        arithmetic runs on whole arrays. Row ``i`` holds the same values as
+        ``score_claim(claims[i], graph)``.
+        
+        Args:
+            claims: Claims to score
+            graph: Optional argument graph for centrality calculation
+            centrality_index: Optional claim text to centrality index of
+                ``graph``, as built by ``build_centrality_index``
+            
+        Returns:
+            Float array of shape (N, 4): salience, credibility, uncertainty
+            and overall score
+        """
+        n = len(claims)
+        evidence_indicators = tuple(self.evidence_indicators)
+        uncertainty_indicators = tuple(self.uncertainty_indicators)
+        texts_lower = [claim.text.lower() for claim in claims]
+        
+        if graph:
+            if centrality_index is None:
+                centrality_index = self.build_centrality_index(graph, "claim")
+            centrality = np.fromiter((centrality_index.get(claim.text, 0.0) for claim in claims),
+                                     dtype=np.float64, count=n)
+        else:
+            centrality = np.zeros(n)
+        
+        # No fastmath, so the kernel gives the same bits as the NumPy path
+        if _claim_score_kernel is not None and n >= _NUMBA_MIN_BATCH:
+            score_columns = _claim_score_kernel
+        else:
+            score_columns = _claim_score_columns
+        
+        return score_columns(
+            np.fromiter((claim.confidence for claim in claims), dtype=np.float64, count=n),
+            np.fromiter((bool(claim.evidence_spans) for claim in claims), dtype=bool, count=n),
+            centrality,
+            np.fromiter((_count_indicators(text_lower, evidence_indicators) for text_lower in texts_lower),
+                        dtype=np.float64, count=n),
+            np.fromiter((_count_indicators(text_lower, uncertainty_indicators) for text_lower in texts_lower),
+                        dtype=np.float64, count=n),
+            self.batch_source_quality([_segment_source(claim.source_segment) for claim in claims])
+        )
+    
+    def claim_uncertainties(self, claims: List[Claim]) -> np.ndarray:
+        """
+        Uncertainty scores for many claims.
+        
+        Same values as ``score_claim(claim).uncertainty``; uncertainty does
+        not depend on the graph, so salience and credibility are skipped.
+        
+        Args:
+            claims: Claims to score
+            
+        Returns:
+            Float array with one uncertainty per claim
+        """
+        return np.fromiter((self._calculate_uncertainty(claim, claim.text.lower()) for claim in claims),
+                           dtype=np.float64, count=len(claims))
+    
+    def stance_uncertainties(self, stances: List[Stance]) -> np.ndarray:
+        """
+        Uncertainty scores for many stances.
+        
+        Same values as ``score_stance(stance).uncertainty``, without the
+        salience and credibility work.
+        
+        Args:
+            stances: Stances to score
+            
+        Returns:
+            Float array with one uncertainty per stance
+        """
+        return np.fromiter((self._calculate_stance_uncertainty(stance) for stance in stances),
+                           dtype=np.float64, count=len(stances))
+    
     def score_entity(self, entity: Entity) -> ArgumentScores:
         """
         Score an entity.
@@ -114,7 +360,8 @@ class ArgumentScorer:
         credibility = self._calculate_entity_credibility(entity)
         uncertainty = self._calculate_entity_uncertainty(entity)
         
-        overall_score = (0.3 * salience + 0.5 * credibility + 0.2 * (1 - uncertainty))
+        overall_score = (_ENTITY_SALIENCE_WEIGHT * salience + _ENTITY_CREDIBILITY_WEIGHT * credibility
+                         + _ENTITY_CERTAINTY_WEIGHT * (1 - uncertainty))
         
         return ArgumentScores(
             salience=salience,
@@ -123,13 +370,45 @@ class ArgumentScorer:
             overall_score=overall_score
         )
     
-    def _calculate_salience(self, claim: Claim, graph: Optional[ArgumentGraph] = None) -> float:
+    def build_centrality_index(self, graph: ArgumentGraph, node_type: str) -> Dict[str, float]:
+        """
+        Index the degree centrality of a graph's claim or stance nodes.
+        
+        Claims are keyed by text and stances by target. When several nodes
+        share a key the first one in node order wins, as in a linear scan.
+        Centrality is computed once per indexed node, not once per argument.
+        
+        Args:
+            graph: Argument graph
+            node_type: "claim" or "stance"
+            
+        Returns:
+            Dictionary mapping claim text or stance target to the matching
+            node's degree divided by the node count
+        """
+        key_of = attrgetter('text') if node_type == 'claim' else attrgetter('stance_target')
+        node_ids = {}
+        
+        # Claim and stance nodes are only created by ArgumentGraph.add_claim and
+        # add_stance, so their content always has the key attribute
+        for node_id, node in graph.nodes.items():
+            if node.node_type == node_type:
+                node_ids.setdefault(key_of(node.content), node_id)
+        
+        degree = graph.graph.degree
+        node_count = max(1, len(graph.nodes))
+        
+        return {key: degree(node_id) / node_count for key, node_id in node_ids.items()}
+    
+    def _calculate_salience(self, claim: Claim, graph: Optional[ArgumentGraph] = None,
+                            centrality_index: Optional[Dict[str, float]] = None) -> float:
         """
         Calculate salience score for a claim.
         
         Args:
             claim: Claim to score
             graph: Optional argument graph
+            centrality_index: Optional claim text to centrality index of ``graph``
             
         Returns:
             Salience score between 0 and 1
@@ -144,23 +423,22 @@ class ArgumentScorer:
         # Boost salience based on graph centrality if available
         if graph:
             # Find the claim node in the graph
-            for node_id, node in graph.nodes.items():
-                if (node.node_type == "claim" and 
-                    hasattr(node.content, 'text') and 
-                    node.content.text == claim.text):
-                    # Get centrality score (simplified)
-                    centrality = graph.graph.degree(node_id) / max(1, len(graph.nodes))
-                    salience += centrality * 0.3
-                    break
+            if centrality_index is None:
+                centrality_index = self.build_centrality_index(graph, "claim")
+            # Get centrality score (simplified)
+            centrality = centrality_index.get(claim.text)
+            if centrality is not None:
+                salience += centrality * 0.3
         
         return min(1.0, salience)
     
-    def _calculate_credibility(self, claim: Claim) -> float:
+    def _calculate_credibility(self, claim: Claim, text_lower: str) -> float:
         """
         Calculate credibility score for a claim.
         
         Args:
             claim: Claim to score
+            text_lower: The claim's text, lowercased
             
         Returns:
             Credibility score between 0 and 1
@@ -168,8 +446,7 @@ class ArgumentScorer:
         credibility = 0.5  # Base credibility
         
         # Boost credibility based on evidence indicators
-        text_lower = claim.text.lower()
-        evidence_count = sum(1 for indicator in self.evidence_indicators if indicator in text_lower)
+        evidence_count = _count_indicators(text_lower, tuple(self.evidence_indicators))
         credibility += min(0.3, evidence_count * 0.1)
         
         # Boost credibility based on source quality
@@ -178,12 +455,13 @@ class ArgumentScorer:
         
         return min(1.0, credibility)
     
-    def _calculate_uncertainty(self, claim: Claim) -> float:
+    def _calculate_uncertainty(self, claim: Claim, text_lower: str) -> float:
         """
         Calculate uncertainty score for a claim.
         
         Args:
             claim: Claim to score
+            text_lower: The claim's text, lowercased
             
         Returns:
             Uncertainty score between 0 and 1
@@ -191,8 +469,7 @@ class ArgumentScorer:
         uncertainty = 0.3  # Base uncertainty
         
         # Increase uncertainty based on uncertainty indicators
-        text_lower = claim.text.lower()
-        uncertainty_count = sum(1 for indicator in self.uncertainty_indicators if indicator in text_lower)
+        uncertainty_count = _count_indicators(text_lower, tuple(self.uncertainty_indicators))
         uncertainty += min(0.4, uncertainty_count * 0.1)
         
         # Decrease uncertainty based on claim confidence
@@ -200,7 +477,8 @@ class ArgumentScorer:
         
         return max(0.0, min(1.0, uncertainty))
     
-    def _calculate_stance_salience(self, stance: Stance, graph: Optional[ArgumentGraph] = None) -> float:
+    def _calculate_stance_salience(self, stance: Stance, graph: Optional[ArgumentGraph] = None,
+                                   centrality_index: Optional[Dict[str, float]] = None) -> float:
         """Calculate salience score for a stance."""
         salience = stance.confidence
         
@@ -210,13 +488,11 @@ class ArgumentScorer:
         
         # Boost salience based on graph centrality if available
         if graph:
-            for node_id, node in graph.nodes.items():
-                if (node.node_type == "stance" and 
-                    hasattr(node.content, 'stance_target') and 
-                    node.content.stance_target == stance.stance_target):
-                    centrality = graph.graph.degree(node_id) / max(1, len(graph.nodes))
-                    salience += centrality * 0.3
-                    break
+            if centrality_index is None:
+                centrality_index = self.build_centrality_index(graph, "stance")
+            centrality = centrality_index.get(stance.stance_target)
+            if centrality is not None:
+                salience += centrality * 0.3
         
         return min(1.0, salience)
     
@@ -294,17 +570,54 @@ class ArgumentScorer:
         Returns:
             Source quality score between 0 and 1
         """
-        source_lower = segment.source.lower()
+        source = _segment_source(segment)
+        source_type = self._source_type_cache.get(source)
+        if source_type is None:
+            source_type = self._classify_source(source)
+            self._source_type_cache[source] = source_type
         
-        # Check for known high-quality sources
-        if any(quality_source in source_lower for quality_source in ['congress', 'senate', 'house', 'federal']):
-            return self.source_quality_weights['official']
-        elif any(academic_source in source_lower for academic_source in ['university', 'college', 'research']):
-            return self.source_quality_weights['academic']
-        elif any(media_source in source_lower for media_source in ['news', 'press', 'media']):
-            return self.source_quality_weights['media']
-        else:
-            return self.source_quality_weights['unknown']
+        return self.source_quality_weights[source_type]
+    
+    def batch_source_quality(self, sources: List[str]) -> np.ndarray:
+        """
+        Get source quality scores for many sources.
+        
+        Gives the same values as ``_get_source_quality``, classifying each
+        distinct source once through the same category cache.
+        
+        Args:
+            sources: Source names
+            
+        Returns:
+            Float array with one source quality per source
+        """
+        cache = self._source_type_cache
+        for source in dict.fromkeys(sources):
+            if source not in cache:
+                cache[source] = self._classify_source(source)
+        
+        weights = self.source_quality_weights
+        return np.fromiter((weights[cache[source]] for source in sources),
+                           dtype=np.float64, count=len(sources))
+    
+    def _classify_source(self, source: str) -> str:
+        """
+        Classify a source string into a source quality category.
+        
+        Args:
+            source: Source name
+            
+        Returns:
+            Key into ``source_quality_weights``
+        """
+        source_lower = source.lower()
+        
+        # Check for known high-quality sources first
+        for source_type, pattern in _SOURCE_TYPE_PATTERNS:
+            if pattern.search(source_lower):
+                return source_type
+        
+        return 'unknown'
     
     def get_aggregate_scores(self, claims: List[Claim], stances: List[Stance], 
                            entities: List[Entity], graph: Optional[ArgumentGraph] = None) -> Dict[str, float]:
@@ -320,13 +633,17 @@ class ArgumentScorer:
         Returns:
             Dictionary with aggregate scores
         """
-        claim_scores = [self.score_claim(claim, graph) for claim in claims]
-        stance_scores = [self.score_stance(stance, graph) for stance in stances]
+        # Index graph centrality once rather than scanning the graph for every argument
+        claim_index = self.build_centrality_index(graph, "claim") if graph else None
+        stance_index = self.build_centrality_index(graph, "stance") if graph else None
+        
+        claim_array = self.score_claims_batch(claims, graph, claim_index)
+        stance_scores = [self.score_stance(stance, graph, stance_index) for stance in stances]
         entity_scores = [self.score_entity(entity) for entity in entities]
         
-        all_scores = claim_scores + stance_scores + entity_scores
+        other_scores = stance_scores + entity_scores
         
-        if not all_scores:
+        if not claims and not other_scores:
             return {
                 'avg_salience': 0.0,
                 'avg_credibility': 0.0,
@@ -334,12 +651,16 @@ class ArgumentScorer:
                 'avg_overall': 0.0
             }
         
-        return {
-            'avg_salience': sum(score.salience for score in all_scores) / len(all_scores),
-            'avg_credibility': sum(score.credibility for score in all_scores) / len(all_scores),
-            'avg_uncertainty': sum(score.uncertainty for score in all_scores) / len(all_scores),
-            'avg_overall': sum(score.overall_score for score in all_scores) / len(all_scores)
-        }
+        # One (N, 4) array and a single column-wise mean instead of four passes
+        other_array = np.fromiter(
+            ((score.salience, score.credibility, score.uncertainty, score.overall_score)
+             for score in other_scores),
+            dtype=np.dtype((np.float64, 4)), count=len(other_scores)
+        )
+        score_array = np.concatenate((claim_array, other_array))
+        means = score_array.mean(axis=0).tolist()
+        
+        return dict(zip(('avg_salience', 'avg_credibility', 'avg_uncertainty', 'avg_overall'), means))
     
     def get_top_scored_arguments(self, claims: List[Claim], stances: List[Stance], 
                                 entities: List[Entity], graph: Optional[ArgumentGraph] = None, 
@@ -357,41 +678,46 @@ class ArgumentScorer:
         Returns:
             List of top-scored arguments with their scores
         """
-        scored_arguments = []
+        # Arguments are scored as they are generated and only the best
+        # top_k are kept, so the full scored list is never built or sorted.
+        # Only those top_k records are turned into dictionaries.
+        top = heapq.nlargest(top_k, self._iter_scored_arguments(claims, stances, entities, graph),
+                             key=lambda x: x.scores.overall_score)
+        return [argument.to_dict() for argument in top]
+    
+    def _iter_scored_arguments(self, claims: List[Claim], stances: List[Stance],
+                               entities: List[Entity],
+                               graph: Optional[ArgumentGraph] = None) -> Iterator[_ScoredArgument]:
+        """
+        Score claims, stances and entities one at a time.
+        
+        Args:
+            claims: List of claims
+            stances: List of stances
+            entities: List of entities
+            graph: Optional argument graph
+            
+        Yields:
+            Scored argument records, claims first, then stances, then entities
+        """
+        # Index graph centrality once rather than scanning the graph for every argument
+        claim_index = self.build_centrality_index(graph, "claim") if graph else None
+        stance_index = self.build_centrality_index(graph, "stance") if graph else None
         
         # Score claims
-        for claim in claims:
-            scores = self.score_claim(claim, graph)
-            scored_arguments.append({
-                'type': 'claim',
-                'content': claim.text,
-                'scores': scores,
-                'source': claim.source_segment
-            })
+        claim_rows = self.score_claims_batch(claims, graph, claim_index).tolist()
+        for claim, row in zip(claims, claim_rows):
+            yield _ScoredArgument('claim', claim.text, ArgumentScores(*row), claim.source_segment)
         
         # Score stances
         for stance in stances:
-            scores = self.score_stance(stance, graph)
-            scored_arguments.append({
-                'type': 'stance',
-                'content': f"{stance.stance_label} towards {stance.stance_target}",
-                'scores': scores,
-                'source': stance.source_segment
-            })
+            scores = self.score_stance(stance, graph, stance_index)
+            yield _ScoredArgument('stance', f"{stance.stance_label} towards {stance.stance_target}",
+                                  scores, stance.source_segment)
         
         # Score entities
         for entity in entities:
-            scores = self.score_entity(entity)
-            scored_arguments.append({
-                'type': 'entity',
-                'content': entity.name,
-                'scores': scores,
-                'source': entity.source_segment
-            })
-        
-        # Sort by overall score and return top k
-        scored_arguments.sort(key=lambda x: x['scores'].overall_score, reverse=True)
-        return scored_arguments[:top_k]
+            yield _ScoredArgument('entity', entity.name, self.score_entity(entity), entity.source_segment)
 
 
 
@@ -5,17 +5,71 @@ This module detects stances (support/oppose/neutral) towards policy targets
 in debate segments and claims.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 from .ingestion import DebateSegment
 from .claim_detection import Claim
+from ._util import DATACLASS_SLOTS, split_sentences
 import re
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+_SUPPORT_INDICATORS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'\b(support|favor|agree|approve|endorse|back|advocate)\b',
+    r'\b(good|beneficial|positive|effective|successful|valuable)\b',
+    r'\b(should|must|need|require|essential|necessary)\b',
+    r'\b(help|assist|improve|enhance|strengthen|promote)\b',
+))
+
+_OPPOSE_INDICATORS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'\b(oppose|against|disagree|reject|denounce|condemn)\b',
+    r'\b(bad|harmful|negative|ineffective|unsuccessful|damaging)\b',
+    r'\b(should\s+not|must\s+not|need\s+not|avoid|prevent)\b',
+    r'\b(hurt|harm|damage|weaken|undermine|threaten)\b',
+))
+
+_NEUTRAL_INDICATORS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'\b(neutral|unclear|uncertain|undecided|mixed)\b',
+    r'\b(maybe|perhaps|possibly|potentially|could)\b',
+    r'\b(consider|examine|study|analyze|review)\b',
+))
+
+# Every indicator pattern above in one alternation, one named group per pattern
+# (s = support, o = oppose, n = neutral, numbered in list order). "should/must/need
+# not" is both the support modal pattern s2 and the oppose negation pattern o2,
+# so it gets its own group counted for both, as the separate scans did.
+_FUSED_INDICATORS = re.compile('|'.join((
+    r'(?P<s2o2>\b(?:should\s+not|must\s+not|need\s+not)\b)',
+    r'(?P<s0>\b(?:support|favor|agree|approve|endorse|back|advocate)\b)',
+    r'(?P<s1>\b(?:good|beneficial|positive|effective|successful|valuable)\b)',
+    r'(?P<s2>\b(?:should|must|need|require|essential|necessary)\b)',
+    r'(?P<s3>\b(?:help|assist|improve|enhance|strengthen|promote)\b)',
+    r'(?P<o0>\b(?:oppose|against|disagree|reject|denounce|condemn)\b)',
+    r'(?P<o1>\b(?:bad|harmful|negative|ineffective|unsuccessful|damaging)\b)',
+    r'(?P<o2>\b(?:avoid|prevent)\b)',
+    r'(?P<o3>\b(?:hurt|harm|damage|weaken|undermine|threaten)\b)',
+    r'(?P<n0>\b(?:neutral|unclear|uncertain|undecided|mixed)\b)',
+    r'(?P<n1>\b(?:maybe|perhaps|possibly|potentially|could)\b)',
+    r'(?P<n2>\b(?:consider|examine|study|analyze|review)\b)',
+)), re.IGNORECASE)
+
+# Stance targets are plain words, so they are found by set lookup over the
+# text's word tokens rather than by regex
+_TARGET_WORDS = frozenset({
+    'policy', 'policies',
+    'bill', 'bills', 'legislation',
+    'regulation', 'regulations',
+    'law', 'laws',
+    'proposal', 'proposals',
+    'initiative', 'initiatives',
+})
+
+_WORD_RE = re.compile(r'\w+')
+
+
+@dataclass(**DATACLASS_SLOTS)
 class Stance:
     """Represents a detected stance towards a target."""
     stance_label: str  # support, oppose, neutral
@@ -29,34 +83,11 @@ class StanceDetector:
     """Detects stances in policy documents and debate segments."""
     
     def __init__(self):
-        self.support_indicators = [
-            r'\b(support|favor|agree|approve|endorse|back|advocate)\b',
-            r'\b(good|beneficial|positive|effective|successful|valuable)\b',
-            r'\b(should|must|need|require|essential|necessary)\b',
-            r'\b(help|assist|improve|enhance|strengthen|promote)\b',
-        ]
-        
-        self.oppose_indicators = [
-            r'\b(oppose|against|disagree|reject|denounce|condemn)\b',
-            r'\b(bad|harmful|negative|ineffective|unsuccessful|damaging)\b',
-            r'\b(should\s+not|must\s+not|need\s+not|avoid|prevent)\b',
-            r'\b(hurt|harm|damage|weaken|undermine|threaten)\b',
-        ]
-        
-        self.neutral_indicators = [
-            r'\b(neutral|unclear|uncertain|undecided|mixed)\b',
-            r'\b(maybe|perhaps|possibly|potentially|could)\b',
-            r'\b(consider|examine|study|analyze|review)\b',
-        ]
-        
-        self.target_patterns = [
-            r'\b(policy|policies)\b',
-            r'\b(bill|bills|legislation)\b',
-            r'\b(regulation|regulations)\b',
-            r'\b(law|laws)\b',
-            r'\b(proposal|proposals)\b',
-            r'\b(initiative|initiatives)\b',
-        ]
+        # Indicator patterns and target words are built once and shared by all instances
+        self.support_indicators = _SUPPORT_INDICATORS
+        self.oppose_indicators = _OPPOSE_INDICATORS
+        self.neutral_indicators = _NEUTRAL_INDICATORS
+        self.target_words = _TARGET_WORDS
     
     def detect_stances(self, segment: DebateSegment) -> List[Stance]:
         """
@@ -70,11 +101,14 @@ class StanceDetector:
         """
         stances = []
         
+        # Lowercased once for target extraction, scoring and evidence
+        text_lower = segment.text.lower()
+        
         # Extract stance targets
-        targets = self._extract_stance_targets(segment.text)
+        targets = self._extract_stance_targets(text_lower)
         
         for target in targets:
-            stance = self._analyze_stance_towards_target(segment, target)
+            stance = self._analyze_stance_towards_target(segment, target, text_lower)
             if stance:
                 stances.append(stance)
         
@@ -93,52 +127,47 @@ class StanceDetector:
         stances = []
         
         for claim in claims:
-            targets = self._extract_stance_targets(claim.text)
+            text_lower = claim.text.lower()
+            targets = self._extract_stance_targets(text_lower)
             
             for target in targets:
-                stance = self._analyze_stance_from_claim(claim, target)
+                stance = self._analyze_stance_from_claim(claim, target, text_lower)
                 if stance:
                     stances.append(stance)
         
         return stances
     
-    def _extract_stance_targets(self, text: str) -> List[str]:
+    def _extract_stance_targets(self, text_lower: str) -> List[str]:
         """
         Extract stance targets from text.
         
         Args:
-            text: Text to analyze
+            text_lower: Lowercased text to analyze
             
         Returns:
-            List of stance targets
+            List of distinct stance targets, in order of first occurrence
         """
-        targets = []
-        text_lower = text.lower()
-        
-        for pattern in self.target_patterns:
-            matches = re.findall(pattern, text_lower, re.IGNORECASE)
-            targets.extend(matches)
-        
-        # Remove duplicates and return
-        return list(set(targets))
+        # A whole \w+ token equal to a target word is exactly a \b-bounded match.
+        # dict.fromkeys drops repeats but keeps first-occurrence order, so the
+        # targets (and the stances built from them) come out in text order.
+        tokens = _WORD_RE.findall(text_lower)
+        return list(dict.fromkeys(filter(self.target_words.__contains__, tokens)))
     
-    def _analyze_stance_towards_target(self, segment: DebateSegment, target: str) -> Optional[Stance]:
+    def _analyze_stance_towards_target(self, segment: DebateSegment, target: str,
+                                       text_lower: str) -> Optional[Stance]:
         """
         Analyze stance towards a specific target.
         
         Args:
             segment: Debate segment
             target: Stance target
+            text_lower: The segment's text, lowercased
             
         Returns:
             Stance object if detected, None otherwise
         """
-        text_lower = segment.text.lower()
-        
         # Calculate stance scores
-        support_score = self._calculate_support_score(text_lower)
-        oppose_score = self._calculate_oppose_score(text_lower)
-        neutral_score = self._calculate_neutral_score(text_lower)
+        support_score, oppose_score, neutral_score = self._score_all(text_lower)
         
         # Determine stance
         if support_score > oppose_score and support_score > neutral_score:
@@ -154,7 +183,7 @@ class StanceDetector:
             return None
         
         # Extract evidence text
-        evidence_text = self._extract_evidence_for_target(segment.text, target)
+        evidence_text = self._extract_evidence_for_target(segment.text, target, text_lower)
         
         return Stance(
             stance_label=stance_label,
@@ -164,23 +193,21 @@ class StanceDetector:
             source_segment=segment
         )
     
-    def _analyze_stance_from_claim(self, claim: Claim, target: str) -> Optional[Stance]:
+    def _analyze_stance_from_claim(self, claim: Claim, target: str,
+                                   text_lower: str) -> Optional[Stance]:
         """
         Analyze stance from a claim towards a target.
         
         Args:
             claim: Claim to analyze
             target: Stance target
+            text_lower: The claim's text, lowercased
             
         Returns:
             Stance object if detected, None otherwise
         """
-        text_lower = claim.text.lower()
-        
         # Calculate stance scores
-        support_score = self._calculate_support_score(text_lower)
-        oppose_score = self._calculate_oppose_score(text_lower)
-        neutral_score = self._calculate_neutral_score(text_lower)
+        support_score, oppose_score, neutral_score = self._score_all(text_lower)
         
         # Determine stance
         if support_score > oppose_score and support_score > neutral_score:
@@ -196,7 +223,7 @@ class StanceDetector:
             return None
         
         # Extract evidence text
-        evidence_text = self._extract_evidence_for_target(claim.text, target)
+        evidence_text = self._extract_evidence_for_target(claim.text, target, text_lower)
         
         return Stance(
             stance_label=stance_label,
@@ -206,12 +233,44 @@ class StanceDetector:
             source_segment=claim.source_segment
         )
     
+    def _score_all(self, text: str) -> Tuple[float, float, float]:
+        """
+        Calculate support, oppose and neutral scores in one scan of the text.
+        
+        Args:
+            text: Text to analyze
+            
+        Returns:
+            The same scores as ``_calculate_support_score``,
+            ``_calculate_oppose_score`` and ``_calculate_neutral_score``
+        """
+        counts = dict.fromkeys(_FUSED_INDICATORS.groupindex, 0)
+        for match in _FUSED_INDICATORS.finditer(text):
+            counts[match.lastgroup] += 1
+        counts['s2'] += counts['s2o2']
+        counts['o2'] += counts['s2o2']
+        
+        # Summed per pattern, in list order, so the floats match the separate scans
+        support_score = 0.0
+        for name in ('s0', 's1', 's2', 's3'):
+            support_score += counts[name] * 0.2
+        
+        oppose_score = 0.0
+        for name in ('o0', 'o1', 'o2', 'o3'):
+            oppose_score += counts[name] * 0.2
+        
+        neutral_score = 0.0
+        for name in ('n0', 'n1', 'n2'):
+            neutral_score += counts[name] * 0.15
+        
+        return min(1.0, support_score), min(1.0, oppose_score), min(1.0, neutral_score)
+    
     def _calculate_support_score(self, text: str) -> float:
         """Calculate support score for text."""
         score = 0.0
         
         for pattern in self.support_indicators:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+            matches = pattern.findall(text)
             score += len(matches) * 0.2
         
         return min(1.0, score)
@@ -221,7 +280,7 @@ class StanceDetector:
         score = 0.0
         
         for pattern in self.oppose_indicators:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+            matches = pattern.findall(text)
             score += len(matches) * 0.2
         
         return min(1.0, score)
@@ -231,28 +290,32 @@ class StanceDetector:
         score = 0.0
         
         for pattern in self.neutral_indicators:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+            matches = pattern.findall(text)
             score += len(matches) * 0.15
         
         return min(1.0, score)
     
-    def _extract_evidence_for_target(self, text: str, target: str) -> str:
+    def _extract_evidence_for_target(self, text: str, target: str, text_lower: str) -> str:
         """
         Extract evidence text for a specific target.
         
         Args:
             text: Full text
             target: Target to find evidence for
+            text_lower: ``text``, lowercased
             
         Returns:
             Evidence text
         """
-        # Simple implementation: return sentences containing the target
-        sentences = re.split(r'[.!?]+', text)
-        
-        for sentence in sentences:
-            if target.lower() in sentence.lower():
-                return sentence.strip()
+        # Simple implementation: return sentences containing the target.
+        # The target is a single word, so skipping blank sentences changes nothing.
+        # Lowercasing never adds or removes sentence delimiters or whitespace, so
+        # the splits of the text and of its lowercased copy line up, and both
+        # splits are memoized across the text's targets.
+        target_lower = target.lower()
+        for sentence, sentence_lower in zip(split_sentences(text), split_sentences(text_lower)):
+            if target_lower in sentence_lower:
+                return sentence
         
         return text[:100] + "..." if len(text) > 100 else text
     
@@ -5,6 +5,7 @@ This module provides business logic for argument mining and analysis.
 """
 
 from typing import List, Dict, Any, Optional
+from dataclasses import asdict
 import logging
 from datetime import datetime
 
@@ -78,7 +79,7 @@ class ArgumentService:
                     "claim": claim.claim_text,
                     "evidence": claim.evidence_text,
                     "claim_type": claim.claim_type,
-                    "score": score.__dict__
+                    "score": asdict(score)
                 })
             
             # Build argument graph
@@ -100,9 +101,9 @@ class ArgumentService:
                     "num_segments": len(segments)
                 },
                 "claims": scored_claims,
-                "stances": [stance.__dict__ for stance in stances],
-                "frames": [frame.__dict__ for frame in frames],
-                "entities": [entity.__dict__ for entity in entities],
+                "stances": [asdict(stance) for stance in stances],
+                "frames": [asdict(frame) for frame in frames],
+                "entities": [asdict(entity) for entity in entities],
                 "argument_graph": graph,
                 "insights": insights
             }
@@ -0,0 +1,50 @@
+"""
+Tests for argument role labeling.
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from policy_argument_mining import argument_role_labeling
+from policy_argument_mining.argument_role_labeling import ArgumentRoleLabeler
+
+
+class TestRoleScores(unittest.TestCase):
+    """Test that every indicator backend gives the same role scores."""
+    
+    def setUp(self):
+        self.labeler = ArgumentRoleLabeler()
+        self.texts = [
+            "However, because the data shows this, we agree but doubt it.",
+            "On the other hand, the study is flawed; therefore we rebut the claim.",
+            "cafébut éhowever ébecause ésince",
+            "ıas ıbut",
+            "Naïve data, but however the café agrees.",
+        ]
+    
+    def re_scores(self, text):
+        """Role scores computed pattern by pattern with re."""
+        return tuple(
+            self.labeler._calculate_role_score(text, indicators)
+            for indicators in self.labeler.role_indicators.values()
+        )
+    
+    def test_scores_match_re(self):
+        """Test that role scores equal the re scores, ASCII or not."""
+        for text in self.texts:
+            self.assertEqual(self.labeler._score_roles(text), self.re_scores(text), text)
+    
+    @unittest.skipIf(argument_role_labeling._HS_DB is None, "hyperscan not installed")
+    def test_hyperscan_matches_re_on_non_ascii(self):
+        """Test that non-ASCII letters next to an indicator do not count as word boundaries."""
+        self.assertEqual(self.labeler._score_roles("cafébut éhowever ébecause ésince"),
+                         (0.0, 0.0, 0.0, 0.0, 0.0))
+        self.assertEqual(self.labeler._score_roles("ıas ıbut"), (0.0, 0.0, 0.0, 0.0, 0.0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+"""
+Tests for entity linking.
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from policy_argument_mining import entity_linking
+from policy_argument_mining.entity_linking import EntityLinker
+from policy_argument_mining.ingestion import DebateSegment
+
+
+def make_segment(text, turn_index=0):
+    """Create a debate segment with the given text."""
+    return DebateSegment("Speaker", None, None, None, text, None, turn_index)
+
+
+class TestEntityRelationships(unittest.TestCase):
+    """Test co-occurrence relationships between linked entities."""
+    
+    def setUp(self):
+        self.linker = EntityLinker()
+        self.first = make_segment("The SEC and Congress debated the bill.", 0)
+        self.second = make_segment("Federal Reserve officials disagreed.", 1)
+        mentions = self.linker.extract_entities(self.first) + self.linker.extract_entities(self.second)
+        self.entities = self.linker.link_entities(mentions)
+    
+    def test_entities_keep_their_segment(self):
+        """Test that linked entities point at their mention's segment."""
+        for entity in self.entities:
+            self.assertIn(entity.source_segment, (self.first, self.second))
+        self.assertIs(next(e for e in self.entities if e.entity_id == "org_fed").source_segment,
+                      self.second)
+    
+    def test_relationships_follow_segments(self):
+        """Test that only entities from the same segment are related."""
+        relationships = self.linker.get_entity_relationships(self.entities)
+        self.assertIn("org_congress", relationships["org_sec"])
+        self.assertNotIn("org_fed", relationships["org_sec"])
+        self.assertNotIn("org_sec", relationships["org_fed"])
+    
+    def test_relationships_match_pairwise_scan(self):
+        """Test that bucketing gives the same result as comparing every pair."""
+        expected = {}
+        for i, entity in enumerate(self.entities):
+            expected.setdefault(entity.entity_id, [])
+            for j, other in enumerate(self.entities):
+                if i != j and entity.source_segment is other.source_segment:
+                    expected[entity.entity_id].append(other.entity_id)
+        self.assertEqual(self.linker.get_entity_relationships(self.entities), expected)
+
+
+class TestGazetteerLookup(unittest.TestCase):
+    """Test exact and fuzzy gazetteer lookups."""
+    
+    def setUp(self):
+        self.orgs = EntityLinker()._org_gazetteer
+    
+    def test_longer_mention_links(self):
+        """Test that a mention containing a known name links to it."""
+        self.assertEqual(self.orgs.lookup("u.s. federal reserve board")["id"], "org_fed")
+    
+    @unittest.skipIf(entity_linking.process is None, "rapidfuzz not installed")
+    def test_misspelled_mention_links(self):
+        """Test that a misspelled name still links through the fuzzy fallback."""
+        self.assertEqual(self.orgs.lookup("u.s. federal reserv board")["id"], "org_fed")
+        self.assertEqual(self.orgs.lookup("senat committee")["id"], "org_senate")
+    
+    def test_lookalike_words_do_not_link(self):
+        """Test that words merely resembling a name are not linked to it."""
+        self.assertIsNone(self.orgs.lookup("housing costs"))
+        self.assertIsNone(self.orgs.lookup("houston chronicle"))
+
+
+if __name__ == '__main__':
+    unittest.main()
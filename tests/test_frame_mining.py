@@ -0,0 +1,107 @@
+"""
+Tests for frame mining.
+"""
+
+import unittest
+import random
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from policy_argument_mining import frame_mining
+from policy_argument_mining.frame_mining import FrameMiner
+from policy_argument_mining.ingestion import DebateSegment
+
+
+WORDS = (
+    "economic growth carbon emissions tax budget climate change health care "
+    "public safety cyber security ai rd data protection deficit reduction café naïve ıas"
+).split()
+
+# Plain and Unicode whitespace, punctuation, and non-ASCII letters glued to keywords
+SEPARATORS = [" ", "  ", "\xa0", "\t", "\n", ", ", "é", "-"]
+
+
+def make_texts(n, seed=0):
+    """Random texts mixing frame keywords with varied separators."""
+    rng = random.Random(seed)
+    return [
+        "".join(rng.choice(WORDS) + rng.choice(SEPARATORS) for _ in range(12))
+        for _ in range(n)
+    ] + [
+        "economic\xa0growth and economic\xa0growth",
+        "cafécarbon emissions and carbon tax",
+    ]
+
+
+def make_segment(text, turn_index=0):
+    """Create a debate segment with the given text."""
+    return DebateSegment("Speaker", None, None, None, text, None, turn_index)
+
+
+def re_miner():
+    """A frame miner forced onto the per-pattern re path."""
+    miner = FrameMiner()
+    miner._hs_db = None
+    miner._automaton = None
+    return miner
+
+
+class TestFrameBackends(unittest.TestCase):
+    """Test that the scan backends score frames like the re patterns."""
+    
+    def setUp(self):
+        self.texts = make_texts(500)
+        self.reference = re_miner()
+    
+    def test_nbsp_between_keyword_words(self):
+        """Test that a no-break space separates the words of a keyword."""
+        scores = self.reference._score_segment_text("economic\xa0growth and economic\xa0growth")
+        self.assertEqual(scores, (("economic_growth", 0.8, "economic\xa0growth"),))
+    
+    @unittest.skipIf(frame_mining.hyperscan is None, "hyperscan not installed")
+    def test_hyperscan_matches_re(self):
+        """Test hyperscan scores, including evidence, against re."""
+        miner = FrameMiner()
+        self.assertIsNotNone(miner._hs_db)
+        for text in self.texts:
+            self.assertEqual(miner._score_segment_text(text),
+                             self.reference._score_segment_text(text), repr(text))
+    
+    @unittest.skipIf(frame_mining.ahocorasick is None, "pyahocorasick not installed")
+    def test_automaton_matches_re(self):
+        """Test Aho-Corasick frame confidences against re."""
+        miner = re_miner()
+        miner._automaton = miner._build_automaton(miner._keyword_targets())
+        for text in self.texts:
+            # The automaton reports evidence with whitespace runs collapsed
+            self.assertEqual([score[:2] for score in miner._score_segment_text(text)],
+                             [score[:2] for score in self.reference._score_segment_text(text)],
+                             repr(text))
+
+
+
+class TestDetectFramesBatch(unittest.TestCase):
+    """Test that batch frame detection matches detecting frames one segment at a time."""
+    
+    def test_batch_matches_loop(self):
+        """Test mixed ASCII and non-ASCII batches against a detect_frames loop."""
+        miner = FrameMiner()
+        texts = make_texts(300, seed=1) + ["carbon\vemissions and carbon\x1ctax", "cafécarbon emissions and carbon tax"]
+        segments = [make_segment(text, i) for i, text in enumerate(texts)]
+        expected = [frame for segment in segments for frame in miner.detect_frames(segment)]
+        self.assertEqual(miner.detect_frames_batch(segments), expected)
+    
+    def test_non_ascii_word_boundaries(self):
+        """Test that a non-ASCII letter before a keyword blocks the match in a batch."""
+        miner = FrameMiner()
+        segment = make_segment("cafécarbon emissions and carbon tax")
+        frames = miner.detect_frames_batch([segment])
+        self.assertEqual([(frame.frame_label, frame.confidence) for frame in frames
+                          if frame.frame_label == "climate_risk"], [("climate_risk", 0.4)])
+
+
+if __name__ == '__main__':
+    unittest.main()
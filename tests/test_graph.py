@@ -0,0 +1,68 @@
+"""
+Tests for argument graphs.
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from policy_argument_mining.graph import ArgumentGraph
+from policy_argument_mining.ingestion import DebateSegment
+from policy_argument_mining.claim_detection import Claim
+from policy_argument_mining.stance_detection import Stance
+
+
+def make_claim(text):
+    """Create a claim on its own debate segment."""
+    segment = DebateSegment("Speaker", None, None, None, text, None, 0)
+    return Claim(text, 0.8, "factual", [], segment)
+
+
+class TestArgumentGraphIds(unittest.TestCase):
+    """Test node IDs of argument graphs."""
+    
+    def setUp(self):
+        self.graph = ArgumentGraph()
+        self.claim_ids = [self.graph.add_claim(make_claim(f"Claim {i}.")) for i in range(3)]
+        claim = make_claim("The bill is good.")
+        self.stance_id = self.graph.add_stance(
+            Stance("support", "bill", 0.7, "good", claim.source_segment)
+        )
+        self.graph.add_edge(self.claim_ids[0], self.claim_ids[1], "supports")
+        self.graph.add_edge(self.claim_ids[1], self.claim_ids[2], "supports")
+        self.graph.add_edge(self.claim_ids[2], self.stance_id, "supports")
+    
+    def test_add_returns_integer_ids(self):
+        """Test that add_* return sequential integer IDs."""
+        self.assertEqual(self.claim_ids + [self.stance_id], [0, 1, 2, 3])
+    
+    def test_central_nodes_are_integer_ids(self):
+        """Test that central nodes are integer IDs of the graph's nodes."""
+        central = self.graph.get_central_nodes(top_k=2)
+        self.assertEqual(len(central), 2)
+        for node_id in central:
+            self.assertIsInstance(node_id, int)
+            self.assertIn(node_id, self.graph.nodes)
+    
+    def test_export_labels_ids_by_type(self):
+        """Test that export_to_dict renders IDs as '<type>_<id>'."""
+        exported = self.graph.export_to_dict()
+        self.assertEqual(list(exported["nodes"]), ["claim_0", "claim_1", "claim_2", "stance_3"])
+        self.assertEqual(exported["edges"][0]["from_node"], "claim_0")
+        self.assertEqual(exported["edges"][0]["to_node"], "claim_1")
+    
+    def test_subgraph_does_not_reuse_ids(self):
+        """Test that nodes added to a subgraph get IDs unused by its parent."""
+        subgraph = self.graph.get_subgraph([self.claim_ids[0], self.claim_ids[1]])
+        self.assertEqual(len(subgraph.edges), 1)
+        
+        new_id = subgraph.add_claim(make_claim("A new claim."))
+        self.assertNotIn(new_id, self.graph.nodes)
+        self.assertEqual(len(subgraph.nodes), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
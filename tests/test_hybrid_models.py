@@ -0,0 +1,108 @@
+"""
+Tests for hybrid models.
+"""
+
+import unittest
+import sys
+from pathlib import Path
+import numpy as np
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from research.hybrid_models import _cox_fit, _concordance_index
+
+
+def simulate_cox(coefficients, n=3000, seed=0):
+    """Draw exponential survival times with hazard exp(X @ coefficients), with random censoring."""
+    rng = np.random.default_rng(seed)
+    X = rng.standard_normal((n, len(coefficients)))
+    event_times = rng.exponential(1.0 / np.exp(X @ np.asarray(coefficients)))
+    censor_times = rng.exponential(2.0, size=n)
+    durations = np.minimum(event_times, censor_times)
+    events = event_times <= censor_times
+    return X, durations, events
+
+
+class TestCoxFit(unittest.TestCase):
+    """Test the Cox proportional hazards fit."""
+    
+    def test_recovers_known_coefficients(self):
+        """Test that the fit recovers the coefficients the data was drawn with."""
+        X, durations, events = simulate_cox([0.8, -0.5, 0.0])
+        beta = _cox_fit(X, durations, events, penalizer=0.0)
+        np.testing.assert_allclose(beta, [0.8, -0.5, 0.0], atol=0.1)
+    
+    def test_single_feature(self):
+        """Test a fit with one feature."""
+        X, durations, events = simulate_cox([1.2], seed=1)
+        beta = _cox_fit(X, durations, events, penalizer=0.0)
+        self.assertEqual(beta.shape, (1,))
+        self.assertAlmostEqual(beta[0], 1.2, delta=0.1)
+    
+    def test_penalizer_shrinks_coefficients(self):
+        """Test that the ridge penalty pulls coefficients towards zero."""
+        X, durations, events = simulate_cox([0.8, -0.5], n=200, seed=2)
+        plain = _cox_fit(X, durations, events, penalizer=0.0)
+        penalized = _cox_fit(X, durations, events, penalizer=50.0)
+        self.assertLess(np.linalg.norm(penalized), np.linalg.norm(plain))
+    
+    def test_no_events(self):
+        """Test that data without events gives zero coefficients."""
+        X, durations, _ = simulate_cox([0.8, -0.5], n=50, seed=3)
+        beta = _cox_fit(X, durations, np.zeros(50, dtype=bool))
+        np.testing.assert_array_equal(beta, [0.0, 0.0])
+    
+    def test_all_events_tied(self):
+        """Test that events all at one time carry no ordering information."""
+        rng = np.random.default_rng(4)
+        X = rng.standard_normal((50, 2))
+        beta = _cox_fit(X, np.ones(50), np.ones(50, dtype=bool))
+        self.assertTrue(np.all(np.isfinite(beta)))
+        np.testing.assert_allclose(beta, [0.0, 0.0], atol=1e-12)
+
+
+class TestConcordanceIndex(unittest.TestCase):
+    """Test Harrell's concordance index."""
+    
+    def test_hand_computed_case(self):
+        """Test a toy case worked out by hand."""
+        durations = np.array([1.0, 2.0, 3.0, 4.0])
+        events = np.array([True, True, False, True])
+        risk = np.array([4.0, 1.0, 1.0, 2.0])
+        # Comparable pairs: (0,1), (0,2), (0,3), (1,2), (1,3). Sample 0 beats
+        # all three, (1,2) is a risk tie and (1,3) is discordant: 3.5 / 5
+        self.assertAlmostEqual(_concordance_index(durations, events, risk), 0.7)
+    
+    def test_perfect_and_reversed_ranking(self):
+        """Test that risk ordered with or against failure time scores 1 or 0."""
+        durations = np.arange(1.0, 11.0)
+        events = np.ones(10, dtype=bool)
+        self.assertEqual(_concordance_index(durations, events, -durations), 1.0)
+        self.assertEqual(_concordance_index(durations, events, durations), 0.0)
+    
+    def test_blocks_match_single_pass(self):
+        """Test that a sample larger than one block gives the same index as a direct count."""
+        X, durations, events = simulate_cox([0.8], n=2500, seed=5)
+        risk = X[:, 0]
+        comparable = events[:, None] & (durations[:, None] < durations[None, :])
+        risk_diff = risk[:, None] - risk[None, :]
+        expected = ((comparable & (risk_diff > 0)).sum()
+                    + 0.5 * (comparable & (risk_diff == 0)).sum()) / comparable.sum()
+        self.assertAlmostEqual(_concordance_index(durations, events, risk), expected)
+    
+    def test_no_events(self):
+        """Test that data without events has no comparable pairs."""
+        durations = np.array([1.0, 2.0, 3.0])
+        events = np.zeros(3, dtype=bool)
+        self.assertEqual(_concordance_index(durations, events, np.array([3.0, 2.0, 1.0])), 0.5)
+    
+    def test_all_events_tied(self):
+        """Test that events all at one time have no comparable pairs."""
+        durations = np.ones(4)
+        events = np.ones(4, dtype=bool)
+        self.assertEqual(_concordance_index(durations, events, np.arange(4.0)), 0.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+"""
+Tests for policy document ingestion.
+"""
+
+import unittest
+from unittest.mock import patch
+import sys
+import json
+import hashlib
+import tempfile
+from pathlib import Path
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from policy_argument_mining import ingestion
+from policy_argument_mining.ingestion import PolicyIngestion
+
+
+def make_record(i):
+    """Create a valid JSONL record."""
+    return {
+        "ext_id": f"doc_{i}",
+        "title": f"Debate {i}",
+        "source": "Senate",
+        "session_date": "2024-01-15T10:00:00",
+        "jurisdiction": "US",
+        "content": f"Speaker {i}: The bill will raise costs."
+    }
+
+
+class TestJsonlIngestion(unittest.TestCase):
+    """Test JSONL ingestion."""
+    
+    def setUp(self):
+        self.ingestion = PolicyIngestion()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp_dir.name) / "docs.jsonl"
+        lines = [json.dumps(make_record(i)).encode("utf-8") for i in range(5)]
+        lines.insert(2, b'{"title": "\xff\xfe broken"}')  # Invalid UTF-8
+        lines.insert(4, b'{not json')
+        self.path.write_bytes(b"\n".join(lines) + b"\n")
+    
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+    
+    def test_decode_lines_reports_bad_lines(self):
+        """Test that invalid JSON and invalid UTF-8 come back as errors."""
+        lines = [b'{"a": 1}', b'{"a": "\xff"}', b'{not json']
+        # Stdlib json raises UnicodeDecodeError rather than JSONDecodeError on invalid UTF-8
+        for loads in {ingestion._json_loads, json.loads}:
+            with patch.object(ingestion, "_json_loads", loads):
+                decoded = ingestion._decode_lines(lines)
+            self.assertEqual(decoded[0], ({"a": 1}, None))
+            self.assertIsNone(decoded[1][0])
+            self.assertIsNotNone(decoded[1][1])
+            self.assertIsNone(decoded[2][0])
+            self.assertIsNotNone(decoded[2][1])
+    
+    def test_content_hash_names_its_algorithm(self):
+        """Test that content hashes carry their algorithm as a prefix."""
+        content = b"The bill will raise costs."
+        with patch.object(ingestion, "blake3", None):
+            self.assertEqual(ingestion._content_hash(content), "md5:" + hashlib.md5(content).hexdigest())
+        if ingestion.blake3 is not None:
+            digest = ingestion._content_hash(content)
+            self.assertTrue(digest.startswith("blake3:"))
+            self.assertEqual(len(digest), len("blake3:") + 64)
+    
+    def test_serial_ingest_skips_bad_lines(self):
+        """Test that the default serial ingest skips undecodable lines."""
+        documents = self.ingestion.ingest_from_jsonl(str(self.path))
+        self.assertEqual([doc.ext_id for doc in documents], [f"doc_{i}" for i in range(5)])
+    
+    def test_parallel_ingest_matches_serial(self):
+        """Test that decoding in worker processes gives the same documents."""
+        serial = self.ingestion.ingest_from_jsonl(str(self.path))
+        with patch.object(ingestion, "_PARALLEL_INGEST_BYTES", 0):
+            parallel = self.ingestion.ingest_from_jsonl(str(self.path), n_jobs=2)
+        self.assertEqual([(doc.ext_id, doc.hash) for doc in parallel],
+                         [(doc.ext_id, doc.hash) for doc in serial])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+"""
+Tests for policy argument integration.
+"""
+
+import unittest
+import sys
+import json
+from dataclasses import asdict
+from pathlib import Path
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from policy_argument_mining.integration import PolicyArgumentIntegrator, PolicySignal
+from policy_argument_mining.ingestion import DebateSegment
+from policy_argument_mining.stance_detection import Stance
+
+
+class TestPolicySignals(unittest.TestCase):
+    """Test policy signals built from stances."""
+    
+    def setUp(self):
+        self.integrator = PolicyArgumentIntegrator()
+        segment = DebateSegment("Speaker", None, None, None, "We support the bill.", None, 0)
+        self.stances = [Stance("support", "bill", 0.8, "support", segment) for _ in range(3)]
+    
+    def test_signal_is_json_serializable(self):
+        """Test that a signal's dictionary form goes through json.dumps."""
+        signal = self.integrator._analyze_consensus(self.stances)
+        data = json.loads(json.dumps(asdict(signal)))
+        self.assertEqual(data["source_arguments"], ["stance_0", "stance_1", "stance_2"])
+    
+    def test_signals_are_hashable(self):
+        """Test that equal signals deduplicate in a set."""
+        signals = {self.integrator._analyze_consensus(self.stances) for _ in range(2)}
+        self.assertEqual(len(signals), 1)
+
+
+class TestImpactEnhancement(unittest.TestCase):
+    """Test impact predictions adjusted by policy signals."""
+    
+    def setUp(self):
+        self.integrator = PolicyArgumentIntegrator()
+        self.base_impact = {'direction': 'positive', 'magnitude': 0.2,
+                            'timeframe': 'long_term', 'confidence': 0.6}
+    
+    def make_signal(self, signal_type, intensity):
+        """Create a policy signal of the given type and intensity."""
+        return PolicySignal(signal_type, intensity, 0.7, "", ())
+    
+    def test_signal_adjustments(self):
+        """Test magnitude, confidence and timeframe changes for each signal type."""
+        signals = [self.make_signal('urgency', 0.5), self.make_signal('polarization', 0.5),
+                   self.make_signal('uncertainty', 0.5)]
+        impact = self.integrator.enhance_impact_prediction(self.base_impact, signals)
+        self.assertAlmostEqual(impact.impact_magnitude, 0.2 + 0.5 * 0.7 + 0.5 * 0.4)
+        self.assertAlmostEqual(impact.confidence, 0.6 - 0.5 * 0.3)
+        self.assertEqual(impact.impact_timeframe, 'short_term')
+        self.assertEqual(impact.policy_signals, signals)
+    
+    def test_neutral_signals_leave_impact_unchanged(self):
+        """Test that consensus and unknown signals do not change the base impact."""
+        signals = [self.make_signal('consensus', 0.9), self.make_signal('other', 0.9)]
+        impact = self.integrator.enhance_impact_prediction(self.base_impact, signals)
+        self.assertEqual((impact.impact_magnitude, impact.confidence, impact.impact_timeframe),
+                         (0.2, 0.6, 'long_term'))
+    
+    def test_limits(self):
+        """Test that magnitude is capped at 1.0 and confidence floored at 0.1."""
+        signals = [self.make_signal('urgency', 1.0)] * 3 + [self.make_signal('uncertainty', 1.0)] * 3
+        impact = self.integrator.enhance_impact_prediction(self.base_impact, signals)
+        self.assertEqual(impact.impact_magnitude, 1.0)
+        self.assertEqual(impact.confidence, 0.1)
+
+
+if __name__ == '__main__':
+    unittest.main()
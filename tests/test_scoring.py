@@ -0,0 +1,194 @@
+"""
+Tests for argument scoring.
+"""
+
+import unittest
+from unittest.mock import patch
+import sys
+from dataclasses import astuple
+from pathlib import Path
+from types import SimpleNamespace
+import numpy as np
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from policy_argument_mining import scoring
+from policy_argument_mining.scoring import ArgumentScorer
+from policy_argument_mining.ingestion import DebateSegment
+from policy_argument_mining.claim_detection import Claim
+from policy_argument_mining.stance_detection import Stance
+from policy_argument_mining.entity_linking import EntityLinker
+from policy_argument_mining.graph import ArgumentGraph
+
+
+def make_segment(text, turn_index=0):
+    """Create a debate segment with the given text."""
+    return DebateSegment(
+        speaker="Speaker",
+        party=None,
+        start_ts=None,
+        end_ts=None,
+        text=text,
+        asr_confidence=None,
+        turn_index=turn_index
+    )
+
+
+class TestSourceClassification(unittest.TestCase):
+    """Test source quality classification."""
+    
+    def setUp(self):
+        self.scorer = ArgumentScorer()
+    
+    def test_keyword_categories(self):
+        """Test that a source takes the category of the first keyword it contains."""
+        self.assertEqual(self.scorer._classify_source("U.S. Senate Committee"), "official")
+        self.assertEqual(self.scorer._classify_source("Congressional Budget Office"), "official")
+        self.assertEqual(self.scorer._classify_source("Harvard University"), "academic")
+        self.assertEqual(self.scorer._classify_source("Independent researchers"), "academic")
+        self.assertEqual(self.scorer._classify_source("Reuters News"), "media")
+        self.assertEqual(self.scorer._classify_source("University Press"), "academic")
+        self.assertEqual(self.scorer._classify_source("Senat hearing"), "unknown")
+        self.assertEqual(self.scorer._classify_source(""), "unknown")
+    
+    def test_batch_matches_single_lookups(self):
+        """Test that batch source quality agrees with one lookup per source."""
+        sources = [
+            "Senat hearing", "Senate", "Harvard University", "Reuters News",
+            "Independent researchers", "Senate", ""
+        ]
+        expected = [
+            self.scorer.source_quality_weights[ArgumentScorer()._classify_source(source)]
+            for source in sources
+        ]
+        self.assertEqual(self.scorer.batch_source_quality(sources).tolist(), expected)
+    
+    def test_segments_without_source(self):
+        """Test that debate segments, which carry no source, score as unknown."""
+        segment = make_segment("The bill will raise costs.")
+        self.assertEqual(self.scorer._get_source_quality(segment),
+                         self.scorer.source_quality_weights["unknown"])
+
+
+def make_claims(n, seed=0):
+    """Create claims with varied confidence, evidence, indicators and sources."""
+    rng = np.random.default_rng(seed)
+    texts = [
+        "The study shows the bill will raise costs.",
+        "Perhaps the policy is unclear and the data is in dispute.",
+        "The regulation will reduce emissions.",
+        "Maybe the evidence from the survey is uncertain.",
+    ]
+    sources = ["U.S. Senate Committee", "Harvard University", "Reuters News", "Housing Blog", "Senat hearing"]
+    claims = []
+    for i in range(n):
+        segment = SimpleNamespace(text=texts[i % len(texts)], source=sources[i % len(sources)])
+        evidence_spans = [(0, 5)] if rng.random() < 0.5 else []
+        claims.append(Claim(f"{texts[i % len(texts)]} ({i % 7})", float(rng.random()), "factual",
+                            evidence_spans, segment))
+    return claims
+
+
+class TestBatchScoring(unittest.TestCase):
+    """Test that batch claim scoring matches scoring claims one at a time."""
+    
+    def setUp(self):
+        self.scorer = ArgumentScorer()
+        self.claims = make_claims(60)
+    
+    def assert_batch_matches_scalar(self, claims, graph=None):
+        """Assert every batch row equals the scalar scores of its claim."""
+        batch = self.scorer.score_claims_batch(claims, graph)
+        expected = np.array([astuple(self.scorer.score_claim(claim, graph)) for claim in claims])
+        np.testing.assert_allclose(batch, expected, rtol=0, atol=1e-12)
+    
+    def test_batch_matches_scalar(self):
+        """Test batch scores without a graph."""
+        self.assert_batch_matches_scalar(self.claims)
+    
+    def test_batch_matches_scalar_with_graph(self):
+        """Test batch scores with graph centrality."""
+        graph = ArgumentGraph()
+        node_ids = [graph.add_claim(claim) for claim in self.claims[:20]]
+        for a, b in zip(node_ids, node_ids[1:]):
+            graph.add_edge(a, b, "supports")
+        graph.add_edge(node_ids[0], node_ids[10], "attacks")
+        self.assert_batch_matches_scalar(self.claims, graph)
+    
+    def test_empty_batch(self):
+        """Test that an empty batch gives an empty (0, 4) array."""
+        self.assertEqual(self.scorer.score_claims_batch([]).shape, (0, 4))
+
+
+@unittest.skipIf(scoring._claim_score_kernel is None, "numba not installed")
+class TestNumbaScoring(unittest.TestCase):
+    """Test that the compiled claim scoring kernel matches the NumPy path."""
+    
+    def test_kernel_matches_numpy_columns(self):
+        """Test the kernel on random inputs, including out-of-range values that get clipped."""
+        rng = np.random.default_rng(0)
+        n = 5000
+        columns = (
+            rng.random(n) * 1.5,
+            rng.random(n) < 0.5,
+            rng.random(n),
+            rng.integers(0, 8, n).astype(np.float64),
+            rng.integers(0, 8, n).astype(np.float64),
+            rng.choice([0.3, 0.6, 0.8, 0.9, 1.0], n),
+        )
+        np.testing.assert_array_equal(scoring._claim_score_kernel(*columns),
+                                      scoring._claim_score_columns(*columns))
+    
+    def test_batch_uses_kernel_consistently(self):
+        """Test that batch scores through the kernel equal the NumPy batch scores."""
+        scorer = ArgumentScorer()
+        claims = make_claims(200)
+        with patch.object(scoring, "_claim_score_kernel", None):
+            expected = scorer.score_claims_batch(claims)
+        with patch.object(scoring, "_NUMBA_MIN_BATCH", 1):
+            np.testing.assert_array_equal(scorer.score_claims_batch(claims), expected)
+
+
+class TestScoringRealSegments(unittest.TestCase):
+    """Test scoring arguments attached to real debate segments."""
+    
+    def setUp(self):
+        self.scorer = ArgumentScorer()
+        segment = make_segment("The bill will raise costs according to the study.")
+        self.claims = [
+            Claim("The bill will raise costs according to the study.", 0.8, "factual",
+                  [(30, 49)], segment),
+            Claim("Perhaps the policy is unclear.", 0.5, "normative", [], segment)
+        ]
+        self.stances = [Stance("oppose", "bill", 0.7, "raise costs", segment)]
+    
+    def test_score_claim(self):
+        """Test that a claim on a debate segment can be scored."""
+        scores = self.scorer.score_claim(self.claims[0])
+        self.assertGreater(scores.overall_score, 0.0)
+    
+    def test_score_claims_batch(self):
+        """Test that claims on debate segments can be scored in a batch."""
+        self.assertEqual(self.scorer.score_claims_batch(self.claims).shape, (2, 4))
+    
+    def test_aggregate_and_top_scores(self):
+        """Test aggregate and top scores over claims and stances."""
+        aggregate = self.scorer.get_aggregate_scores(self.claims, self.stances, [])
+        self.assertGreater(aggregate["avg_overall"], 0.0)
+        
+        top = self.scorer.get_top_scored_arguments(self.claims, self.stances, [], top_k=2)
+        self.assertEqual(len(top), 2)
+        self.assertGreaterEqual(top[0]["scores"].overall_score, top[1]["scores"].overall_score)
+    
+    def test_top_scores_with_entities(self):
+        """Test that linked entities report their source segment."""
+        linker = EntityLinker()
+        segment = self.claims[0].source_segment
+        entities = linker.link_entities(linker.extract_entities(segment))
+        top = self.scorer.get_top_scored_arguments([], [], entities, top_k=1)
+        self.assertIs(top[0]["source"], segment)
+
+
+if __name__ == '__main__':
+    unittest.main()